@@ -5,121 +5,219 @@ Benchmark runner script for PeakRDL-pybind11
 This script provides convenient commands for running different benchmark scenarios.
 """
 
+import os
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TypedDict
 
 
 class Command(TypedDict):
-    cmd: list[str]
     description: str
+    targets: list[str]
+    args: list[str]
 
 
-def run_command(cmd: list[str], description: str) -> int:
+class ParallelCommand(TypedDict):
+    cmds: list[list[str]]
+    description: str
+
+
+def use_tmpfs() -> None:
+    """Point TMPDIR at /dev/shm, unless it is already set.
+
+    The benchmarks write generated sources and build trees under the temp
+    directory; on tmpfs those writes never reach a block device. Set in our
+    own environment so both in-process pytest and child processes see it.
+    tempfile caches its directory on first use, so drop the cache as well.
+    """
+    shm = Path("/dev/shm")
+    if "TMPDIR" not in os.environ and shm.is_dir() and os.access(shm, os.W_OK):
+        os.environ["TMPDIR"] = str(shm)
+        tempfile.tempdir = None
+
+
+def run_command(cmd: list[str], description: str, in_process: bool = True) -> int:
     """Run a command and print description"""
     print(f"\n{'=' * 70}")
     print(f"{description}")
     print(f"{'=' * 70}")
     print(f"Command: {' '.join(cmd)}\n")
 
+    if cmd[0] == "pytest":
+        # Run pytest in this interpreter rather than paying a fresh interpreter
+        # start plus pytest/systemrdl/exporter imports. pytest can't be run
+        # more than once per process, so later sessions get a subprocess.
+        if in_process:
+            import pytest
+
+            return int(pytest.main(cmd[1:]))
+        cmd = [sys.executable, "-m", *cmd]
+
     result = subprocess.run(cmd)
     return result.returncode
 
 
-def main() -> int:
-    """Main entry point"""
-    benchmarks_dir = Path(__file__).parent
+def run_parallel(cmds: list[list[str]], description: str) -> int:
+    """Run independent commands concurrently, one subprocess each.
 
-    commands: dict[str, Command] = {
-        "all": {
-            "description": "Run all benchmarks (including slow build tests)",
-            "cmd": ["pytest", str(benchmarks_dir), "--benchmark-only", "-v"],
-        },
-        "fast": {
-            "description": "Run fast export benchmarks only (skip slow build tests)",
-            "cmd": ["pytest", str(benchmarks_dir), "--benchmark-only", "-v", "-m", "not slow"],
-        },
-        "export": {
-            "description": "Run export benchmarks",
-            "cmd": [
-                "pytest",
-                f"{benchmarks_dir}/test_benchmarks.py::TestExportBenchmarks",
-                "--benchmark-only",
-                "-v",
-            ],
-        },
-        "scaling": {
-            "description": "Run scalability benchmarks",
-            "cmd": [
-                "pytest",
-                f"{benchmarks_dir}/test_benchmarks.py::TestScalabilityBenchmarks",
-                "--benchmark-only",
-                "-v",
-            ],
-        },
-        "memory": {
-            "description": "Run memory benchmarks",
-            "cmd": [
-                "pytest",
-                f"{benchmarks_dir}/test_benchmarks.py::TestMemoryBenchmarks",
-                "--benchmark-only",
-                "-v",
-            ],
-        },
-        "build": {
-            "description": "Run build benchmarks (requires python-build, cmake, compiler)",
-            "cmd": [
-                "pytest",
-                f"{benchmarks_dir}/test_benchmarks.py::TestBuildBenchmarks",
-                "--benchmark-only",
-                "-v",
-            ],
-        },
-        "compare": {
-            "description": "Run benchmarks and save for comparison",
-            "cmd": [
+    Only used for pass/fail runs: pytest-benchmark disables itself under
+    pytest-xdist, and timings taken while other suites compete for the CPU
+    aren't comparable anyway, so timed commands stay serial. Each job's
+    output is buffered and printed when it finishes so logs don't interleave.
+    """
+    print(f"\n{'=' * 70}")
+    print(f"{description}")
+    print(f"{'=' * 70}")
+    for cmd in cmds:
+        print(f"Command: {' '.join(cmd)}")
+    print()
+
+    def run_one(cmd: list[str]) -> int:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        print(f"--- {' '.join(cmd)} (exit {result.returncode})")
+        print(result.stdout, end="")
+        print(result.stderr, end="", file=sys.stderr)
+        return result.returncode
+
+    with ThreadPoolExecutor(max_workers=min(len(cmds), os.cpu_count() or 1)) as pool:
+        returncodes = list(pool.map(run_one, cmds))
+    return max(returncodes, default=0)
+
+
+def _mk(description: str, *targets: str, args: tuple[str, ...] = ()) -> Command:
+    """Describe a pytest run over ``targets`` (relative to the benchmarks directory)"""
+    return {"description": description, "targets": list(targets) or [""], "args": list(args)}
+
+
+def build_pytest_cmds(benchmarks_dir: Path, selected: list[Command]) -> list[list[str]]:
+    """Merge the selected commands into as few pytest invocations as possible.
+
+    Commands with the same extra arguments share one invocation, so
+    ``export memory`` runs both suites in one session instead of starting
+    pytest twice. Commands with different arguments get an invocation each,
+    since a marker filter such as ``fast``'s ``-m "not slow"`` must not apply
+    to another command's targets. Within an invocation, a command over the
+    whole directory subsumes the narrower targets. The collector is off
+    inside timed rounds so its pauses don't land in the measurements.
+    """
+    groups: dict[tuple[str, ...], dict[str, None]] = {}
+    for command in selected:
+        groups.setdefault(tuple(command["args"]), {}).update(dict.fromkeys(command["targets"]))
+
+    cmds: list[list[str]] = []
+    for args, targets in groups.items():
+        if "" in targets:
+            targets = {"": None}
+        cmds.append(
+            [
                 "pytest",
-                str(benchmarks_dir),
+                *(str(benchmarks_dir / target) if target else str(benchmarks_dir) for target in targets),
                 "--benchmark-only",
+                "--benchmark-disable-gc",
                 "-v",
-                "--benchmark-autosave",
-                "--benchmark-save=baseline",
-            ],
-        },
-        "histogram": {
-            "description": "Generate benchmark histogram",
-            "cmd": [
-                "pytest",
-                str(benchmarks_dir),
-                "--benchmark-only",
-                "--benchmark-histogram=benchmark_histogram",
+                *args,
+            ]
+        )
+    return cmds
+
+
+COMMANDS: dict[str, Command] = {
+    "all": _mk("Run all benchmarks (including slow build tests)"),
+    "fast": _mk("Run fast export benchmarks only (skip slow build tests)", args=("-m", "not slow")),
+    "export": _mk("Run export benchmarks", "test_benchmarks.py::TestExportBenchmarks"),
+    "stages": _mk(
+        "Run compile, elaborate and export benchmarks separately per RDL file",
+        "test_benchmarks.py::TestStageBenchmarks",
+    ),
+    "scaling": _mk("Run scalability benchmarks", "test_benchmarks.py::TestScalabilityBenchmarks"),
+    "memory": _mk("Run memory benchmarks", "test_benchmarks.py::TestMemoryBenchmarks"),
+    "build": _mk(
+        "Run build benchmarks (requires python-build, cmake, compiler)",
+        "test_benchmarks.py::TestBuildBenchmarks",
+    ),
+    "compare": _mk(
+        "Run benchmarks and save for comparison",
+        args=("--benchmark-autosave", "--benchmark-save=baseline"),
+    ),
+    "histogram": _mk("Generate benchmark histogram", args=("--benchmark-histogram=benchmark_histogram",)),
+}
+
+
+def main() -> int:
+    """Main entry point"""
+    benchmarks_dir = Path(__file__).parent
+
+    # Every fast suite once, as a correctness check, with one pytest process
+    # per suite so they run side by side.
+    smoke_targets = [
+        f"{benchmarks_dir}/test_benchmarks.py::TestExportBenchmarks",
+        f"{benchmarks_dir}/test_benchmarks.py::TestStageBenchmarks",
+        f"{benchmarks_dir}/test_benchmarks.py::TestScalabilityBenchmarks",
+        f"{benchmarks_dir}/test_benchmarks.py::TestMemoryBenchmarks",
+        *(
+            str(path)
+            for path in sorted(benchmarks_dir.glob("test_*.py"))
+            if path.name != "test_benchmarks.py"
+        ),
+    ]
+    parallel_commands: dict[str, ParallelCommand] = {
+        "smoke": {
+            "description": "Run each fast benchmark once without timing, suites in parallel",
+            "cmds": [
+                [sys.executable, "-m", "pytest", target, "--benchmark-disable", "-q", "-m", "not slow"]
+                for target in smoke_targets
             ],
         },
     }
 
-    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+    use_tmpfs()
+
+    names = sys.argv[1:]
+    if names == ["smoke"]:
+        parallel_info = parallel_commands["smoke"]
+        return run_parallel(parallel_info["cmds"], parallel_info["description"])
+
+    # ``smoke`` is an untimed pass/fail run with its own pytest options, so
+    # it doesn't chain with the timed commands.
+    if len(names) > 1 and "smoke" in names:
+        print(
+            "error: 'smoke' must be run on its own; it cannot be combined with other commands",
+            file=sys.stderr,
+        )
+        return 1
+    unknown = [name for name in names if name not in COMMANDS]
+    if unknown:
+        print(f"error: unknown command(s): {', '.join(unknown)}", file=sys.stderr)
+
+    if not names or unknown:
         print("PeakRDL-pybind11 Benchmark Runner")
         print("=" * 70)
-        print("\nUsage: python run_benchmarks.py <command>")
+        print("\nUsage: python run_benchmarks.py <command> [<command> ...]")
         print("\nAvailable commands:\n")
 
-        for name, info in commands.items():
+        for name, info in COMMANDS.items():
             print(f"  {name:12s} - {info['description']}")
+        for name, parallel_info in parallel_commands.items():
+            print(f"  {name:12s} - {parallel_info['description']} (standalone only)")
 
         print("\nExamples:")
         print("  python run_benchmarks.py fast       # Quick export benchmarks")
         print("  python run_benchmarks.py export     # All export benchmarks")
         print("  python run_benchmarks.py all        # Everything")
+        print("  python run_benchmarks.py export memory  # Several suites in one pytest run")
+        print("  python run_benchmarks.py smoke      # Check the benchmarks still pass (on its own)")
         print("\nFor more options, run pytest directly:")
         print("  pytest benchmarks/ --benchmark-only --help")
 
         return 1
 
-    command = sys.argv[1]
-    cmd_info = commands[command]
-
-    return run_command(cmd_info["cmd"], cmd_info["description"])
+    selected = [COMMANDS[name] for name in dict.fromkeys(names)]
+    description = " + ".join(command["description"] for command in selected)
+    cmds = build_pytest_cmds(benchmarks_dir, selected)
+    return max(run_command(cmd, description, in_process=index == 0) for index, cmd in enumerate(cmds))
 
 
 if __name__ == "__main__":
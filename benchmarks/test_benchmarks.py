@@ -11,505 +11,742 @@ The benchmarks use different complexity levels:
 - Large: ~70 registers across 15+ peripherals
 """
 
+import functools
+import gc
 import importlib.util
+import itertools
 import os
+import shutil
 import subprocess
-import tempfile
+import sys
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from pytest_benchmark.fixture import BenchmarkFixture
 from systemrdl.compiler import RDLCompiler
+from systemrdl.node import AddrmapNode
 
 from peakrdl_pybind11 import Pybind11Exporter
 
+if TYPE_CHECKING:
+    from build import ProjectBuilder
+    from build.env import DefaultIsolatedEnv
+
+_RDL_DIR = Path(__file__).resolve().parent / "rdl_files"
+SIMPLE_RDL = str(_RDL_DIR / "simple.rdl")
+MEDIUM_RDL = str(_RDL_DIR / "medium.rdl")
+LARGE_RDL = str(_RDL_DIR / "large.rdl")
+REALISTIC_MCU_RDL = str(_RDL_DIR / "realistic_mcu.rdl")
+
+# Probed once at import; TestBuildBenchmarks is skipped as a whole without it.
+_HAS_BUILD = importlib.util.find_spec("build") is not None
+
+
+@functools.cache
+def _elaborate_rdl(rdl_path: str) -> AddrmapNode:
+    """Compile and elaborate an RDL file once per session, keyed by absolute path.
+
+    The exporter only reads the elaborated tree, so every benchmark round can
+    share the same ``root.top`` and keep compile/elaborate out of the timed
+    region.
+    """
+    rdl = RDLCompiler()
+    rdl.compile_file(rdl_path)
+    return rdl.elaborate().top
+
+
+# Extra environment for the wheel-build benchmarks. pytest-benchmark turns
+# itself off under pytest-xdist, so instead of running builds side by side we
+# let CMake compile each build's translation units on every core (the large
+# export is split into many binding chunks). An explicit setting from the
+# caller wins.
+_WHEEL_BUILD_ENV: dict[str, str] = (
+    {}
+    if "CMAKE_BUILD_PARALLEL_LEVEL" in os.environ
+    else {"CMAKE_BUILD_PARALLEL_LEVEL": str(os.cpu_count() or 1)}
+)
+
+# Opt-in compiler cache for the wheel builds (``PEAKRDL_BENCH_CCACHE=1``).
+# Off by default: every round compiles identical sources, so a warm cache
+# turns the wheel numbers into packaging-overhead numbers. Useful when only
+# the non-compile part of the build is under study. The PCH sloppiness flags
+# let ccache cache translation units that use the generated precompiled
+# header.
+_USE_CCACHE = bool(os.environ.get("PEAKRDL_BENCH_CCACHE")) and shutil.which("ccache") is not None
+if _USE_CCACHE:
+    _WHEEL_BUILD_ENV.update(
+        {
+            "CMAKE_C_COMPILER_LAUNCHER": "ccache",
+            "CMAKE_CXX_COMPILER_LAUNCHER": "ccache",
+            "CCACHE_SLOPPINESS": os.environ.get("CCACHE_SLOPPINESS", "pch_defines,time_macros"),
+        }
+    )
+
+
+def _project_builder(env: "DefaultIsolatedEnv", source_dir: Path, distribution: str) -> "ProjectBuilder":
+    """Return a ``ProjectBuilder`` for ``source_dir`` that runs its backend hooks in ``env``.
+
+    Backend hooks run with their output captured; wheel builds also get
+    ``_WHEEL_BUILD_ENV``.
+    """
+    from build import ProjectBuilder
+    from pyproject_hooks import quiet_subprocess_runner
+
+    def runner(
+        cmd: Sequence[str], cwd: str | None = None, extra_environ: Mapping[str, str] | None = None
+    ) -> None:
+        quiet_subprocess_runner(cmd, cwd, {**_WHEEL_BUILD_ENV, **(extra_environ or {})})
 
-class TestExportBenchmarks:
-    """Benchmark the RDL to pybind11 export process"""
+    return ProjectBuilder.from_isolated_env(
+        env, source_dir, runner=runner if distribution == "wheel" else quiet_subprocess_runner
+    )
 
-    @pytest.fixture(scope="class")
-    def benchmark_dir(self) -> Path:
-        """Get the benchmarks directory"""
-        return Path(__file__).parent / "rdl_files"
 
-    def test_export_simple_rdl(self, benchmark: BenchmarkFixture, benchmark_dir: Path) -> None:
-        """Benchmark export of simple RDL file (3 registers)"""
-        rdl_file = benchmark_dir / "simple.rdl"
+def _install_build_requires(env: "DefaultIsolatedEnv", source_dir: Path, distribution: str) -> None:
+    """Install ``source_dir``'s build requirements into ``env``.
 
-        def export_simple() -> str:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl = RDLCompiler()
-                rdl.compile_file(str(rdl_file))
-                root = rdl.elaborate()
+    Runs outside the benchmarked callable; installs into an already-populated
+    ``env`` are near no-ops.
+    """
+    builder = _project_builder(env, source_dir, distribution)
+    env.install(builder.build_system_requires)
+    env.install(builder.get_requires_for_build(distribution))
 
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, tmpdir, soc_name="simple_bench")
 
-                # Verify output was created
-                assert os.path.exists(os.path.join(tmpdir, "simple_bench_descriptors.hpp"))
-                return tmpdir
+def _clone_tree(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst``, sharing file extents copy-on-write where the filesystem can.
 
-        result = benchmark(export_simple)
+    ``cp --reflink=auto`` clones with one ioctl per file on btrfs/XFS and
+    silently falls back to a regular copy elsewhere; non-GNU platforms use
+    ``shutil.copytree``.
+    """
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        subprocess.run(["cp", "-a", "--reflink=auto", str(src), str(dst)], check=True)
+    else:
+        shutil.copytree(src, dst, symlinks=True)
 
-    def test_export_medium_rdl(self, benchmark: BenchmarkFixture, benchmark_dir: Path) -> None:
-        """Benchmark export of medium RDL file (~20 registers, 4 peripherals)"""
-        rdl_file = benchmark_dir / "medium.rdl"
 
-        def export_medium() -> str:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl = RDLCompiler()
-                rdl.compile_file(str(rdl_file))
-                root = rdl.elaborate()
+# Timed rounds per build benchmark (pytest-benchmark's default minimum).
+_BUILD_ROUNDS = 5
 
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, tmpdir, soc_name="medium_bench")
 
-                # Verify output was created
-                assert os.path.exists(os.path.join(tmpdir, "medium_bench_descriptors.hpp"))
-                return tmpdir
+def _bench_build(
+    benchmark: BenchmarkFixture,
+    env: "DefaultIsolatedEnv",
+    export_dir: Path,
+    distribution: str,
+    workdir: Path,
+) -> str:
+    """Time building ``distribution`` from a pristine clone of ``export_dir``.
 
-        result = benchmark(export_medium)
+    Each round's setup clones the shared export tree, so builds never see
+    artefacts a previous round left in the source tree and the exporter
+    never reruns. Returns the path of the last built artefact.
+    """
+    _install_build_requires(env, export_dir, distribution)
+    outdir = workdir / "dist"
+    clone_ids = itertools.count()
 
-    def test_export_large_rdl(self, benchmark: BenchmarkFixture, benchmark_dir: Path) -> None:
-        """Benchmark export of large RDL file (~70 registers, 15+ peripherals)"""
-        rdl_file = benchmark_dir / "large.rdl"
+    def setup() -> tuple[tuple["ProjectBuilder"], dict[str, object]]:
+        source_dir = workdir / f"src_{next(clone_ids)}"
+        _clone_tree(export_dir, source_dir)
+        gc.collect()
+        return (_project_builder(env, source_dir, distribution),), {}
 
-        def export_large() -> str:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl = RDLCompiler()
-                rdl.compile_file(str(rdl_file))
-                root = rdl.elaborate()
+    def build(builder: "ProjectBuilder") -> str:
+        return builder.build(distribution, outdir)
 
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, tmpdir, soc_name="large_bench")
+    # With ccache on, one untimed round primes the cache.
+    warmup_rounds = 1 if distribution == "wheel" and _USE_CCACHE else 0
+    return benchmark.pedantic(build, setup=setup, rounds=_BUILD_ROUNDS, warmup_rounds=warmup_rounds)
 
-                # Verify output was created
-                assert os.path.exists(os.path.join(tmpdir, "large_bench_descriptors.hpp"))
-                return tmpdir
 
-        result = benchmark(export_large)
+# Rounds per export benchmark. ``pedantic`` runs a fixed count instead of
+# auto-calibrating because every round needs the ``setup`` hook below.
+_EXPORT_ROUNDS = 20
+# Untimed rounds that absorb first-call costs (template compilation, lazy
+# imports) before measurement starts.
+_EXPORT_WARMUP_ROUNDS = 2
 
-    def test_export_large_rdl_with_splitting(self, benchmark: BenchmarkFixture, benchmark_dir: Path) -> None:
-        """Benchmark export with binding splitting enabled (split every 10 registers)"""
-        rdl_file = benchmark_dir / "large.rdl"
 
-        def export_with_splitting() -> str:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl = RDLCompiler()
-                rdl.compile_file(str(rdl_file))
-                root = rdl.elaborate()
+def _clean_dir(path: Path) -> None:
+    """Empty ``path`` in place so each round starts from the same state.
 
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, tmpdir, soc_name="large_bench", split_bindings=10)
+    Reusing one directory (instead of a fresh ``TemporaryDirectory`` per
+    round) keeps mkdir/rmtree churn out of the measurement.
+    """
+    for entry in path.iterdir():
+        if entry.is_dir():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
 
-                # Verify split files were created
-                assert os.path.exists(os.path.join(tmpdir, "large_bench_bindings_0.cpp"))
-                return tmpdir
 
-        result = benchmark(export_with_splitting)
+_REG_TEMPLATE = "    reg { field { sw = rw; hw = r; } data%d[7:0]; } reg%d @ 0x%04x;\n"
+_HIER_REG_TEMPLATE = "    reg { field { sw = rw; } f[7:0]; } r%d @ 0x%04x;\n"
 
-    def test_export_large_rdl_hierarchical_split(
-        self, benchmark: BenchmarkFixture, benchmark_dir: Path
-    ) -> None:
-        """Benchmark export with hierarchical splitting enabled"""
-        rdl_file = benchmark_dir / "large.rdl"
 
-        def export_hierarchical() -> str:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl = RDLCompiler()
-                rdl.compile_file(str(rdl_file))
-                root = rdl.elaborate()
+def _make_scaling_rdl(n: int) -> str:
+    """Return an addrmap with ``n`` single-field registers.
 
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, tmpdir, soc_name="large_bench", split_by_hierarchy=True)
+    Built with one ``str.join`` so generation stays linear in ``n``.
+    """
+    parts = [f"addrmap scaling_test_{n} {{\n"]
+    parts.extend(_REG_TEMPLATE % (i, i, i * 4) for i in range(n))
+    parts.append("};\n")
+    return "".join(parts)
 
-                # Verify output was created
-                assert os.path.exists(os.path.join(tmpdir, "large_bench_descriptors.hpp"))
-                return tmpdir
 
-        result = benchmark(export_hierarchical)
+def _make_hierarchical_rdl(num_regfiles: int, regs_per_regfile: int) -> str:
+    """Return an addrmap of ``num_regfiles`` regfiles x ``regs_per_regfile`` registers.
 
-    def test_export_realistic_mcu(self, benchmark: BenchmarkFixture, benchmark_dir: Path) -> None:
-        """Benchmark export of realistic MCU RDL file (~288 registers, real-world complexity)
+    Every regfile has the same body, so it is formatted once and reused.
+    """
+    body = "".join(_HIER_REG_TEMPLATE % (j, j * 4) for j in range(regs_per_regfile))
+    parts = ["addrmap large_hierarchical {\n"]
+    for i in range(num_regfiles):
+        parts.extend((f"  regfile rf{i} {{\n", body, f"  }} rf{i} @ 0x{i * 0x1000:x};\n"))
+    parts.append("};\n")
+    return "".join(parts)
 
-        This test uses a realistic microcontroller register map inspired by ARM Cortex-M
-        based MCUs with multiple UARTs, SPIs, I2C, Timers, ADC, DMA, GPIO banks, etc.
-        Represents real-world embedded systems design with 300+ registers.
-        """
-        rdl_file = benchmark_dir / "realistic_mcu.rdl"
 
-        def export_realistic() -> str:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl = RDLCompiler()
-                rdl.compile_file(str(rdl_file))
-                root = rdl.elaborate()
+# Keyword options forwarded to ``Pybind11Exporter.export``.
+_ExportOption = str | int | bool
 
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, tmpdir, soc_name="realistic_mcu")
 
-                # Verify output was created
-                assert os.path.exists(os.path.join(tmpdir, "realistic_mcu_descriptors.hpp"))
-                return tmpdir
+def _export_setup(
+    rdl_path: str, outdir: Path, **export_kwargs: _ExportOption
+) -> Callable[[], tuple[tuple[AddrmapNode, str], dict[str, _ExportOption]]]:
+    """Build a ``benchmark.pedantic`` setup hook for an export-only round.
 
-        result = benchmark(export_realistic)
+    The hook resolves the (memoized) elaborated tree and empties ``outdir``,
+    then hands both to the benchmarked callable, so parse and elaborate time
+    never lands in the export measurement. It also runs a full collection, so
+    every round starts from the same heap; run_benchmarks.py passes
+    ``--benchmark-disable-gc`` so the collector stays out of the round itself.
+    """
 
-    def test_export_realistic_mcu_with_splitting(
-        self, benchmark: BenchmarkFixture, benchmark_dir: Path
-    ) -> None:
-        """Benchmark export of realistic MCU with binding splitting (split every 50 registers)"""
-        rdl_file = benchmark_dir / "realistic_mcu.rdl"
+    def setup() -> tuple[tuple[AddrmapNode, str], dict[str, _ExportOption]]:
+        root_top = _elaborate_rdl(rdl_path)
+        _clean_dir(outdir)
+        gc.collect()
+        return (root_top, str(outdir)), export_kwargs
 
-        def export_with_splitting() -> str:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl = RDLCompiler()
-                rdl.compile_file(str(rdl_file))
-                root = rdl.elaborate()
+    return setup
 
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, tmpdir, soc_name="realistic_mcu", split_bindings=50)
 
-                # Verify split files were created
-                assert os.path.exists(os.path.join(tmpdir, "realistic_mcu_bindings_0.cpp"))
-                return tmpdir
+@pytest.fixture(scope="session")
+def exporter() -> Pybind11Exporter:
+    """One exporter shared by the export benchmarks.
 
-        result = benchmark(export_with_splitting)
+    ``export()`` resets its per-run state, and reusing the instance keeps its
+    Jinja environment's compiled templates, so the timed rounds measure
+    steady-state export rather than first-use template compilation (which
+    the warmup rounds would otherwise have to absorb per test).
+    """
+    return Pybind11Exporter()
 
 
-class TestBuildBenchmarks:
-    """Benchmark the build process for distribution files"""
+# Register counts exercised by the scaling benchmarks.
+_SCALING_SIZES = (10, 50, 100, 500)
 
-    @pytest.fixture(scope="class")
-    def benchmark_dir(self) -> Path:
-        """Get the benchmarks directory"""
-        return Path(__file__).parent / "rdl_files"
 
-    @pytest.fixture(scope="class")
-    def simple_export_dir(self, benchmark_dir: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
-        """Create a simple export for build benchmarking"""
-        tmpdir = tmp_path_factory.mktemp("simple_export")
-        rdl_file = benchmark_dir / "simple.rdl"
+@pytest.fixture(scope="session")
+def scaling_rdl_files(tmp_path_factory: pytest.TempPathFactory) -> dict[int, Path]:
+    """Generated scaling RDL sources keyed by register count, written once per session."""
+    rdl_dir = tmp_path_factory.mktemp("scaling_rdl")
+    rdl_files: dict[int, Path] = {}
+    for n in _SCALING_SIZES:
+        rdl_file = rdl_dir / f"scale_{n}.rdl"
+        rdl_file.write_bytes(_make_scaling_rdl(n).encode("ascii"))
+        rdl_files[n] = rdl_file
+    return rdl_files
 
-        rdl = RDLCompiler()
-        rdl.compile_file(str(rdl_file))
-        root = rdl.elaborate()
 
-        exporter = Pybind11Exporter()
-        exporter.export(root.top, str(tmpdir), soc_name="simple_bench")
+@pytest.fixture(scope="session")
+def scaling_roots(scaling_rdl_files: dict[int, Path]) -> dict[int, AddrmapNode]:
+    """Elaborated scaling designs keyed by register count, built once per session."""
+    return {n: _elaborate_rdl(str(rdl_file)) for n, rdl_file in scaling_rdl_files.items()}
 
-        return tmpdir
 
-    @pytest.fixture(scope="class")
-    def medium_export_dir(self, benchmark_dir: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
-        """Create a medium export for build benchmarking"""
-        tmpdir = tmp_path_factory.mktemp("medium_export")
-        rdl_file = benchmark_dir / "medium.rdl"
+def _bench_scaling_export(
+    benchmark: BenchmarkFixture,
+    exporter: Pybind11Exporter,
+    scaling_roots: dict[int, AddrmapNode],
+    n: int,
+    outdir: Path,
+) -> None:
+    """Time exporting the ``n``-register scaling design into a pre-cleaned ``outdir``."""
+    root_top = scaling_roots[n]
 
-        rdl = RDLCompiler()
-        rdl.compile_file(str(rdl_file))
-        root = rdl.elaborate()
+    def export_scaling() -> None:
+        exporter.export(root_top, str(outdir), soc_name=f"scale_{n}")
 
-        exporter = Pybind11Exporter()
-        exporter.export(root.top, str(tmpdir), soc_name="medium_bench")
+    def setup() -> None:
+        _clean_dir(outdir)
+        gc.collect()
 
-        return tmpdir
+    benchmark.pedantic(
+        export_scaling,
+        setup=setup,
+        rounds=_EXPORT_ROUNDS,
+        warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+    )
 
-    @pytest.fixture(scope="class")
-    def large_export_dir(self, benchmark_dir: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
-        """Create a large export for build benchmarking"""
-        tmpdir = tmp_path_factory.mktemp("large_export")
-        rdl_file = benchmark_dir / "large.rdl"
 
-        rdl = RDLCompiler()
-        rdl.compile_file(str(rdl_file))
-        root = rdl.elaborate()
+@pytest.fixture(scope="class")
+def reusable_outdir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One output directory per test class.
 
-        exporter = Pybind11Exporter()
-        exporter.export(root.top, str(tmpdir), soc_name="large_bench", split_bindings=10)
+    Lives under pytest's temp directory, which ``run_benchmarks.py`` points at
+    ``/dev/shm`` so the generated sources stay off the block device.
+    """
+    return tmp_path_factory.mktemp("export_out")
 
-        return tmpdir
 
-    @pytest.mark.slow
-    def test_build_sdist_simple(self, benchmark: BenchmarkFixture, simple_export_dir: Path) -> None:
-        """Benchmark building source distribution (tar.gz) for simple project"""
+class TestExportBenchmarks:
+    """Benchmark the RDL to pybind11 export process"""
 
-        def build_sdist() -> bool:
-            result = subprocess.run(
-                ["python", "-m", "build", "--sdist", "--outdir", "/tmp/dist"],
-                cwd=simple_export_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            return result.returncode == 0
+    def test_export_simple_rdl(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
+        """Benchmark export of simple RDL file (3 registers)"""
+        benchmark.pedantic(
+            exporter.export,
+            setup=_export_setup(SIMPLE_RDL, reusable_outdir, soc_name="simple_bench"),
+            rounds=_EXPORT_ROUNDS,
+            warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+        )
+
+        # Verify output was created
+        assert (reusable_outdir / "simple_bench_descriptors.hpp").exists()
+
+    def test_export_medium_rdl(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
+        """Benchmark export of medium RDL file (~20 registers, 4 peripherals)"""
+        benchmark.pedantic(
+            exporter.export,
+            setup=_export_setup(MEDIUM_RDL, reusable_outdir, soc_name="medium_bench"),
+            rounds=_EXPORT_ROUNDS,
+            warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+        )
+
+        # Verify output was created
+        assert (reusable_outdir / "medium_bench_descriptors.hpp").exists()
+
+    def test_export_large_rdl(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
+        """Benchmark export of large RDL file (~70 registers, 15+ peripherals)"""
+        benchmark.pedantic(
+            exporter.export,
+            setup=_export_setup(LARGE_RDL, reusable_outdir, soc_name="large_bench"),
+            rounds=_EXPORT_ROUNDS,
+            warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+        )
+
+        # Verify output was created
+        assert (reusable_outdir / "large_bench_descriptors.hpp").exists()
+
+    def test_export_large_rdl_with_splitting(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
+        """Benchmark export with binding splitting enabled (split every 10 registers)"""
+        benchmark.pedantic(
+            exporter.export,
+            setup=_export_setup(LARGE_RDL, reusable_outdir, soc_name="large_bench", split_bindings=10),
+            rounds=_EXPORT_ROUNDS,
+            warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+        )
 
-        # Only run if build tools are available
-        if not importlib.util.find_spec("build"):
-            pytest.skip("python-build not installed")
+        # Verify split files were created
+        assert (reusable_outdir / "large_bench_bindings_0.cpp").exists()
 
-        success = benchmark(build_sdist)
-        assert success, "sdist build failed"
+    def test_export_large_rdl_hierarchical_split(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
+        """Benchmark export with hierarchical splitting enabled"""
+        benchmark.pedantic(
+            exporter.export,
+            setup=_export_setup(LARGE_RDL, reusable_outdir, soc_name="large_bench", split_by_hierarchy=True),
+            rounds=_EXPORT_ROUNDS,
+            warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+        )
+
+        # Verify output was created
+        assert (reusable_outdir / "large_bench_descriptors.hpp").exists()
+
+    def test_export_realistic_mcu(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
+        """Benchmark export of realistic MCU RDL file (~288 registers, real-world complexity)
 
-    @pytest.mark.slow
-    def test_build_wheel_simple(self, benchmark: BenchmarkFixture, simple_export_dir: Path) -> None:
-        """Benchmark building wheel distribution for simple project"""
+        This test uses a realistic microcontroller register map inspired by ARM Cortex-M
+        based MCUs with multiple UARTs, SPIs, I2C, Timers, ADC, DMA, GPIO banks, etc.
+        Represents real-world embedded systems design with 300+ registers.
+        """
+        benchmark.pedantic(
+            exporter.export,
+            setup=_export_setup(REALISTIC_MCU_RDL, reusable_outdir, soc_name="realistic_mcu"),
+            rounds=_EXPORT_ROUNDS,
+            warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+        )
 
-        def build_wheel() -> bool:
-            result = subprocess.run(
-                ["python", "-m", "build", "--wheel", "--outdir", "/tmp/dist"],
-                cwd=simple_export_dir,
-                capture_output=True,
-                text=True,
-                timeout=180,
-            )
-            return result.returncode == 0
+        # Verify output was created
+        assert (reusable_outdir / "realistic_mcu_descriptors.hpp").exists()
 
-        # Only run if build tools are available
-        if not importlib.util.find_spec("build"):
-            pytest.skip("python-build not installed")
+    def test_export_realistic_mcu_with_splitting(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
+        """Benchmark export of realistic MCU with binding splitting (split every 50 registers)"""
+        benchmark.pedantic(
+            exporter.export,
+            setup=_export_setup(
+                REALISTIC_MCU_RDL, reusable_outdir, soc_name="realistic_mcu", split_bindings=50
+            ),
+            rounds=_EXPORT_ROUNDS,
+            warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+        )
+
+        # Verify split files were created
+        assert (reusable_outdir / "realistic_mcu_bindings_0.cpp").exists()
+
+    def test_export_realistic_mcu_with_splitting_jobs(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
+        """Benchmark split export of realistic MCU with chunks rendered on one thread per CPU"""
+        benchmark.pedantic(
+            exporter.export,
+            setup=_export_setup(
+                REALISTIC_MCU_RDL,
+                reusable_outdir,
+                soc_name="realistic_mcu",
+                split_bindings=50,
+                jobs=os.cpu_count() or 1,
+            ),
+            rounds=_EXPORT_ROUNDS,
+            warmup_rounds=_EXPORT_WARMUP_ROUNDS,
+        )
+
+        # Verify split files were created
+        assert (reusable_outdir / "realistic_mcu_bindings_0.cpp").exists()
+
+
+# RDL inputs for the per-stage benchmarks, keyed by the size label used in test ids.
+_STAGE_RDL = {
+    "simple": SIMPLE_RDL,
+    "medium": MEDIUM_RDL,
+    "large": LARGE_RDL,
+    "realistic_mcu": REALISTIC_MCU_RDL,
+}
+_STAGE_ROUNDS = 10
+
+
+class TestStageBenchmarks:
+    """Benchmark compile, elaborate and export separately for each RDL file
+
+    Each stage's inputs are prepared in the pedantic setup hook from the
+    previous stage, so a regression in one stage can't hide behind an
+    improvement in another.
+    """
+
+    @pytest.mark.parametrize("stage", ["compile", "elaborate", "export"])
+    @pytest.mark.parametrize("size", list(_STAGE_RDL))
+    def test_stage(
+        self,
+        benchmark: BenchmarkFixture,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+        size: str,
+        stage: str,
+    ) -> None:
+        """Benchmark one pipeline stage for one RDL file"""
+        rdl_path = _STAGE_RDL[size]
 
-        success = benchmark(build_wheel)
-        assert success, "wheel build failed"
+        if stage == "compile":
 
-    @pytest.mark.slow
-    def test_build_sdist_medium(self, benchmark: BenchmarkFixture, medium_export_dir: Path) -> None:
-        """Benchmark building source distribution for medium project"""
+            def fresh_compiler() -> tuple[tuple[RDLCompiler], dict[str, object]]:
+                gc.collect()
+                return (RDLCompiler(),), {}
+
+            def compile_only(rdl: RDLCompiler) -> None:
+                rdl.compile_file(rdl_path)
 
-        def build_sdist() -> bool:
-            result = subprocess.run(
-                ["python", "-m", "build", "--sdist", "--outdir", "/tmp/dist"],
-                cwd=medium_export_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
+            benchmark.pedantic(compile_only, setup=fresh_compiler, rounds=_STAGE_ROUNDS)
+        elif stage == "elaborate":
+
+            def compiled() -> tuple[tuple[RDLCompiler], dict[str, object]]:
+                rdl = RDLCompiler()
+                rdl.compile_file(rdl_path)
+                gc.collect()
+                return (rdl,), {}
+
+            def elaborate_only(rdl: RDLCompiler) -> None:
+                rdl.elaborate()
+
+            benchmark.pedantic(elaborate_only, setup=compiled, rounds=_STAGE_ROUNDS)
+        else:
+            benchmark.pedantic(
+                exporter.export,
+                setup=_export_setup(rdl_path, reusable_outdir, soc_name=f"{size}_stage"),
+                rounds=_STAGE_ROUNDS,
+                warmup_rounds=_EXPORT_WARMUP_ROUNDS,
             )
-            return result.returncode == 0
 
-        if not importlib.util.find_spec("build"):
-            pytest.skip("python-build not installed")
 
-        success = benchmark(build_sdist)
-        assert success, "sdist build failed"
+@pytest.fixture(scope="module")
+def isolated_build_env() -> Iterator["DefaultIsolatedEnv"]:
+    """One isolated PEP 517 build environment shared by every build benchmark.
 
-    @pytest.mark.slow
-    def test_build_wheel_medium(self, benchmark: BenchmarkFixture, medium_export_dir: Path) -> None:
-        """Benchmark building wheel distribution for medium project"""
+    Creating the venv and installing the backend (scikit-build-core,
+    pybind11) is the bulk of ``python -m build``'s overhead; doing it once
+    here leaves only the backend's own build step in the timed region.
+    """
+    from build.env import DefaultIsolatedEnv
 
-        def build_wheel() -> bool:
-            result = subprocess.run(
-                ["python", "-m", "build", "--wheel", "--outdir", "/tmp/dist"],
-                cwd=medium_export_dir,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-            return result.returncode == 0
+    with DefaultIsolatedEnv() as env:
+        yield env
 
-        if not importlib.util.find_spec("build"):
-            pytest.skip("python-build not installed")
 
-        success = benchmark(build_wheel)
-        assert success, "wheel build failed"
+def _export_tree(
+    tmp_path_factory: pytest.TempPathFactory, rdl_path: str, **export_kwargs: _ExportOption
+) -> Path:
+    """Export ``rdl_path`` once into a fresh directory that build rounds clone from."""
+    soc_name = str(export_kwargs["soc_name"])
+    tmpdir = tmp_path_factory.mktemp(f"{soc_name}_export")
+    Pybind11Exporter().export(_elaborate_rdl(rdl_path), str(tmpdir), **export_kwargs)
+    return tmpdir
 
-    @pytest.mark.slow
-    def test_build_sdist_large(self, benchmark: BenchmarkFixture, large_export_dir: Path) -> None:
-        """Benchmark building source distribution for large project"""
 
-        def build_sdist() -> bool:
-            result = subprocess.run(
-                ["python", "-m", "build", "--sdist", "--outdir", "/tmp/dist"],
-                cwd=large_export_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            return result.returncode == 0
+@pytest.fixture(scope="module")
+def simple_export_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a simple export for build benchmarking"""
+    return _export_tree(tmp_path_factory, SIMPLE_RDL, soc_name="simple_bench")
 
-        if not importlib.util.find_spec("build"):
-            pytest.skip("python-build not installed")
 
-        success = benchmark(build_sdist)
-        assert success, "sdist build failed"
+@pytest.fixture(scope="module")
+def medium_export_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a medium export for build benchmarking"""
+    return _export_tree(tmp_path_factory, MEDIUM_RDL, soc_name="medium_bench")
 
-    @pytest.mark.slow
-    def test_build_wheel_large(self, benchmark: BenchmarkFixture, large_export_dir: Path) -> None:
-        """Benchmark building wheel distribution for large project with split bindings"""
 
-        def build_wheel() -> bool:
-            result = subprocess.run(
-                ["python", "-m", "build", "--wheel", "--outdir", "/tmp/dist"],
-                cwd=large_export_dir,
-                capture_output=True,
-                text=True,
-                timeout=600,
-            )
-            return result.returncode == 0
+@pytest.fixture(scope="module")
+def large_export_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a large export for build benchmarking (shared by the sdist and wheel builds)"""
+    return _export_tree(tmp_path_factory, LARGE_RDL, soc_name="large_bench", split_bindings=10)
 
-        if not importlib.util.find_spec("build"):
-            pytest.skip("python-build not installed")
 
-        success = benchmark(build_wheel)
-        assert success, "wheel build failed"
+@pytest.mark.skipif(not _HAS_BUILD, reason="python-build not installed")
+class TestBuildBenchmarks:
+    """Benchmark the build process for distribution files"""
 
+    @pytest.mark.slow
+    def test_build_sdist_simple(
+        self,
+        benchmark: BenchmarkFixture,
+        simple_export_dir: Path,
+        isolated_build_env: "DefaultIsolatedEnv",
+        tmp_path: Path,
+    ) -> None:
+        """Benchmark building source distribution (tar.gz) for simple project"""
+        artifact = _bench_build(benchmark, isolated_build_env, simple_export_dir, "sdist", tmp_path)
+        assert Path(artifact).exists(), "sdist build failed"
 
-class TestMemoryBenchmarks:
-    """Benchmark memory usage during export and build"""
+    @pytest.mark.slow
+    def test_build_wheel_simple(
+        self,
+        benchmark: BenchmarkFixture,
+        simple_export_dir: Path,
+        isolated_build_env: "DefaultIsolatedEnv",
+        tmp_path: Path,
+    ) -> None:
+        """Benchmark building wheel distribution for simple project"""
+        benchmark.extra_info["ccache"] = _USE_CCACHE
+        artifact = _bench_build(benchmark, isolated_build_env, simple_export_dir, "wheel", tmp_path)
+        assert Path(artifact).exists(), "wheel build failed"
 
-    @pytest.fixture(scope="class")
-    def benchmark_dir(self) -> Path:
-        """Get the benchmarks directory"""
-        return Path(__file__).parent / "rdl_files"
+    @pytest.mark.slow
+    def test_build_sdist_medium(
+        self,
+        benchmark: BenchmarkFixture,
+        medium_export_dir: Path,
+        isolated_build_env: "DefaultIsolatedEnv",
+        tmp_path: Path,
+    ) -> None:
+        """Benchmark building source distribution for medium project"""
+        artifact = _bench_build(benchmark, isolated_build_env, medium_export_dir, "sdist", tmp_path)
+        assert Path(artifact).exists(), "sdist build failed"
 
-    def test_memory_export_large(self, benchmark: BenchmarkFixture, benchmark_dir: Path) -> None:
-        """Measure peak memory during large RDL export"""
-        rdl_file = benchmark_dir / "large.rdl"
+    @pytest.mark.slow
+    def test_build_wheel_medium(
+        self,
+        benchmark: BenchmarkFixture,
+        medium_export_dir: Path,
+        isolated_build_env: "DefaultIsolatedEnv",
+        tmp_path: Path,
+    ) -> None:
+        """Benchmark building wheel distribution for medium project"""
+        benchmark.extra_info["ccache"] = _USE_CCACHE
+        artifact = _bench_build(benchmark, isolated_build_env, medium_export_dir, "wheel", tmp_path)
+        assert Path(artifact).exists(), "wheel build failed"
 
-        def export_and_measure() -> dict[str, float]:
-            import tracemalloc
+    @pytest.mark.slow
+    def test_build_sdist_large(
+        self,
+        benchmark: BenchmarkFixture,
+        large_export_dir: Path,
+        isolated_build_env: "DefaultIsolatedEnv",
+        tmp_path: Path,
+    ) -> None:
+        """Benchmark building source distribution for large project"""
+        artifact = _bench_build(benchmark, isolated_build_env, large_export_dir, "sdist", tmp_path)
+        assert Path(artifact).exists(), "sdist build failed"
 
-            tracemalloc.start()
+    @pytest.mark.slow
+    def test_build_wheel_large(
+        self,
+        benchmark: BenchmarkFixture,
+        large_export_dir: Path,
+        isolated_build_env: "DefaultIsolatedEnv",
+        tmp_path: Path,
+    ) -> None:
+        """Benchmark building wheel distribution for large project with split bindings"""
+        benchmark.extra_info["ccache"] = _USE_CCACHE
+        artifact = _bench_build(benchmark, isolated_build_env, large_export_dir, "wheel", tmp_path)
+        assert Path(artifact).exists(), "wheel build failed"
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl = RDLCompiler()
-                rdl.compile_file(str(rdl_file))
-                root = rdl.elaborate()
 
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, tmpdir, soc_name="large_bench")
+def _peak_rss_mib() -> float:
+    """Return this process's ru_maxrss in MiB on Linux and macOS."""
+    import resource
 
-                current, peak = tracemalloc.get_traced_memory()
-                tracemalloc.stop()
+    maximum = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return maximum / divisor
 
-                return {"current_mb": current / 1024 / 1024, "peak_mb": peak / 1024 / 1024}
 
-        result = benchmark(export_and_measure)
+# Opt-in allocation tracing for the memory benchmark
+# (``PEAKRDL_BENCH_TRACEMALLOC=1``). tracemalloc hooks every allocation and
+# slows the exporter several times over, so it is off by default.
+_TRACE_MEMORY = bool(os.environ.get("PEAKRDL_BENCH_TRACEMALLOC"))
 
 
-class TestScalabilityBenchmarks:
-    """Test how performance scales with register count"""
+class TestMemoryBenchmarks:
+    """Benchmark memory usage during export and build"""
 
-    def test_scaling_with_register_count(self, benchmark: BenchmarkFixture) -> None:
-        """Benchmark how export time scales with number of registers"""
+    def test_memory_export_large(self, benchmark: BenchmarkFixture, reusable_outdir: Path) -> None:
+        """Measure peak memory during large RDL export
 
-        def create_and_export_n_registers(n: int) -> None:
-            """Create RDL with n registers and export it"""
-            rdl_content = f"addrmap scaling_test_{n} {{\n"
-            for i in range(n):
-                rdl_content += f"""
-    reg {{
-        field {{
-            sw = rw;
-            hw = r;
-        }} data{i}[7:0];
-    }} reg{i} @ 0x{i * 4:04x};
-"""
-            rdl_content += "};\n"
+        The peak is sampled in one untimed run and published through
+        ``benchmark.extra_info``; the timed rounds run uninstrumented.
+        ``rss_growth_mb`` is how far that run raised the process's peak RSS,
+        so it reads 0 when an earlier test already peaked higher.
+        """
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                # Write RDL file
-                rdl_file = os.path.join(tmpdir, "test.rdl")
-                with open(rdl_file, "w") as f:
-                    f.write(rdl_content)
+        def export_large() -> None:
+            _clean_dir(reusable_outdir)
+            rdl = RDLCompiler()
+            rdl.compile_file(LARGE_RDL)
+            root = rdl.elaborate()
 
-                # Compile and export
-                rdl = RDLCompiler()
-                rdl.compile_file(rdl_file)
-                root = rdl.elaborate()
-
-                output_dir = os.path.join(tmpdir, "output")
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, output_dir, soc_name=f"scale_{n}")
-
-        # Test with 10 registers (baseline)
-        benchmark.pedantic(lambda: create_and_export_n_registers(10), iterations=5, rounds=3)
-
-    def test_scaling_50_registers(self, benchmark: BenchmarkFixture) -> None:
-        """Benchmark export with 50 registers"""
-
-        def create_and_export() -> None:
-            n = 50
-            rdl_content = f"addrmap scaling_test_{n} {{\n"
-            for i in range(n):
-                rdl_content += f"""
-    reg {{
-        field {{ sw = rw; hw = r; }} data{i}[7:0];
-    }} reg{i} @ 0x{i * 4:04x};
-"""
-            rdl_content += "};\n"
+            exporter = Pybind11Exporter()
+            exporter.export(root.top, str(reusable_outdir), soc_name="large_bench")
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl_file = os.path.join(tmpdir, "test.rdl")
-                with open(rdl_file, "w") as f:
-                    f.write(rdl_content)
+        if sys.platform != "win32":
+            gc.collect()
+            start = _peak_rss_mib()
+            export_large()
+            peak = _peak_rss_mib()
+            benchmark.extra_info["peak_rss_mb"] = peak
+            benchmark.extra_info["rss_growth_mb"] = peak - start
 
-                rdl = RDLCompiler()
-                rdl.compile_file(rdl_file)
-                root = rdl.elaborate()
-
-                output_dir = os.path.join(tmpdir, "output")
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, output_dir, soc_name=f"scale_{n}")
-
-        benchmark(create_and_export)
-
-    def test_scaling_100_registers(self, benchmark: BenchmarkFixture) -> None:
-        """Benchmark export with 100 registers"""
-
-        def create_and_export() -> None:
-            n = 100
-            rdl_content = f"addrmap scaling_test_{n} {{\n"
-            for i in range(n):
-                rdl_content += f"""
-    reg {{
-        field {{ sw = rw; hw = r; }} data{i}[7:0];
-    }} reg{i} @ 0x{i * 4:04x};
-"""
-            rdl_content += "};\n"
+        if _TRACE_MEMORY:
+            import tracemalloc
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl_file = os.path.join(tmpdir, "test.rdl")
-                with open(rdl_file, "w") as f:
-                    f.write(rdl_content)
+            tracemalloc.start()
+            try:
+                export_large()
+                current, peak_traced = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            benchmark.extra_info["current_mb"] = current / 1024 / 1024
+            benchmark.extra_info["peak_mb"] = peak_traced / 1024 / 1024
+        benchmark(export_large)
 
-                rdl = RDLCompiler()
-                rdl.compile_file(rdl_file)
-                root = rdl.elaborate()
 
-                output_dir = os.path.join(tmpdir, "output")
-                exporter = Pybind11Exporter()
-                exporter.export(root.top, output_dir, soc_name=f"scale_{n}")
+# The 10k-register export takes seconds per round; a few rounds are enough.
+_HIERARCHICAL_ROUNDS = 3
+
+
+class TestScalabilityBenchmarks:
+    """Test how performance scales with register count"""
 
-        benchmark(create_and_export)
+    @pytest.mark.parametrize("n", _SCALING_SIZES)
+    def test_scaling(
+        self,
+        benchmark: BenchmarkFixture,
+        scaling_roots: dict[int, AddrmapNode],
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+        n: int,
+    ) -> None:
+        """Benchmark how export time scales with number of registers"""
+        _bench_scaling_export(benchmark, exporter, scaling_roots, n, reusable_outdir)
 
     @pytest.mark.slow
-    def test_scaling_large_hierarchical(self, benchmark: BenchmarkFixture) -> None:
+    def test_scaling_large_hierarchical(
+        self,
+        benchmark: BenchmarkFixture,
+        tmp_path: Path,
+        reusable_outdir: Path,
+        exporter: Pybind11Exporter,
+    ) -> None:
         """Benchmark hierarchical export with 10k registers (100 regfiles x 100 regs each)
 
         This test validates the O(n) performance optimization for hierarchical splitting.
         Previously this would take 5+ minutes, now should complete in <1 second.
         """
+        # Create 10k registers in hierarchical structure, then compile and
+        # elaborate it once; the timed rounds only export it. Not memoized via
+        # _elaborate_rdl so the tree isn't pinned for the rest of the session.
+        rdl_file = tmp_path / "large_hierarchical.rdl"
+        rdl_file.write_bytes(_make_hierarchical_rdl(num_regfiles=100, regs_per_regfile=100).encode("ascii"))
+        rdl = RDLCompiler()
+        rdl.compile_file(str(rdl_file))
+        root_top = rdl.elaborate().top
 
-        def create_and_export() -> None:
-            # Create 10k registers in hierarchical structure
-            rdl_content = "addrmap large_hierarchical {\n"
-            for i in range(100):  # 100 regfiles
-                rdl_content += f"  regfile rf{i} {{\n"
-                for j in range(100):  # 100 registers per regfile
-                    rdl_content += f"    reg {{ field {{ sw = rw; }} f[7:0]; }} r{j} @ 0x{j * 4:04x};\n"
-                rdl_content += f"  }} rf{i} @ 0x{i * 0x1000:x};\n"
-            rdl_content += "};\n"
-
-            with tempfile.TemporaryDirectory() as tmpdir:
-                rdl_file = os.path.join(tmpdir, "test.rdl")
-                with open(rdl_file, "w") as f:
-                    f.write(rdl_content)
-
-                rdl = RDLCompiler()
-                rdl.compile_file(rdl_file)
-                root = rdl.elaborate()
-
-                output_dir = os.path.join(tmpdir, "output")
-                exporter = Pybind11Exporter()
-                # Use hierarchical splitting - this is what we optimized
-                exporter.export(root.top, output_dir, soc_name="large_hier", split_by_hierarchy=True)
+        def setup() -> tuple[tuple[AddrmapNode, str], dict[str, _ExportOption]]:
+            _clean_dir(reusable_outdir)
+            gc.collect()
+            # Use hierarchical splitting - this is what we optimized
+            return (root_top, str(reusable_outdir)), {"soc_name": "large_hier", "split_by_hierarchy": True}
 
-        benchmark(create_and_export)
+        benchmark.pedantic(exporter.export, setup=setup, rounds=_HIERARCHICAL_ROUNDS)
@@ -153,7 +153,7 @@ def main() -> None:
                 print("   ✓ __len__: Get number of entries")
             if "__getitem__" in content:
                 print("   ✓ __getitem__: Access by index")
-            if "py::slice" in content:
+            if "py::slice" in content or "nb::slice" in content:
                 print("   ✓ __getitem__ with slicing: Access by slice")
             if "__iter__" in content:
                 print("   ✓ __iter__: Iteration support")
@@ -7,6 +7,7 @@ Note: This is a demonstration of the generated C++ code structure, not a working
 """
 
 import os
+import re
 import tempfile
 
 from systemrdl import RDLCompiler
@@ -111,6 +112,9 @@ addrmap demo_soc {
 };
 """
 
+# Matches each class name declared on a line of the generated header.
+_CLASS_RE = re.compile(r"\bclass (\w+)")
+
 
 def main() -> None:
     print("=" * 80)
@@ -152,29 +156,36 @@ def main() -> None:
             ]
 
             lines = content.split("\n")
+
+            # Index the first line declaring each class in one pass over the
+            # header, instead of rescanning it for every class shown below.
+            class_lines: dict[str, int] = {}
+            for i, line in enumerate(lines):
+                for match in _CLASS_RE.finditer(line):
+                    class_lines.setdefault(match.group(1), i)
+
             for class_name, description in classes:
                 print(f"{class_name} - {description}")
                 print("─" * 80)
 
                 # Find the __repr__ method for this class
-                for i, line in enumerate(lines):
-                    if f"class {class_name}" in line or f"class {class_name}<" in line:
-                        # Look for __repr__ in the next 100 lines
-                        for j in range(i, min(i + 100, len(lines))):
-                            if "__repr__() const" in lines[j]:
-                                # Print the __repr__ method
-                                k = j
-                                while k < len(lines) and "return" not in lines[k]:
-                                    print(f"  {lines[k]}")
-                                    k += 1
-                                # Print the return line and closing brace
-                                if k < len(lines):
-                                    print(f"  {lines[k]}")
-                                    k += 1
-                                if k < len(lines) and "}" in lines[k]:
-                                    print(f"  {lines[k]}")
-                                break
-                        break
+                i = class_lines.get(class_name)
+                if i is not None:
+                    # Look for __repr__ in the next 100 lines
+                    for j in range(i, min(i + 100, len(lines))):
+                        if "__repr__() const" in lines[j]:
+                            # Print the __repr__ method
+                            k = j
+                            while k < len(lines) and "return" not in lines[k]:
+                                print(f"  {lines[k]}")
+                                k += 1
+                            # Print the return line and closing brace
+                            if k < len(lines):
+                                print(f"  {lines[k]}")
+                                k += 1
+                            if k < len(lines) and "}" in lines[k]:
+                                print(f"  {lines[k]}")
+                            break
                 print()
 
             print()
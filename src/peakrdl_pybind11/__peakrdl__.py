@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
     from peakrdl.plugins.exporter import ExporterSubcommandPlugin
     from systemrdl.node import AddrmapNode
+
+    from .exporter import Pybind11Exporter
 else:
     try:
         from peakrdl.plugins.exporter import ExporterSubcommandPlugin  # pyrefly: ignore[missing-import]
@@ -17,7 +19,11 @@ else:
         ExporterSubcommandPlugin = object  # type: ignore[misc]
 
 from . import cli as _cli
-from .exporter import _KNOWN_UDPS, Pybind11Exporter
+
+# Only the light constants module is imported here: ``peakrdl`` loads this
+# plugin to build its argument parser on every invocation, so the exporter
+# itself (and jinja2 with it) is imported on first use in ``_get_exporter``.
+from ._constants import _KNOWN_UDPS, BACKENDS
 
 
 def _build_udp_definitions() -> list[type]:
@@ -58,6 +64,20 @@ class Exporter(ExporterSubcommandPlugin):
     # declare `property is_flag {...};` etc. themselves.
     udp_definitions = _build_udp_definitions()
 
+    # One exporter serves every ``do_export`` in the process (e.g. a driver
+    # exporting several designs). ``export()`` resets its per-run state, and
+    # keeping the instance keeps its Jinja environment's loaded templates.
+    _exporter: "Pybind11Exporter | None" = None
+
+    @classmethod
+    def _get_exporter(cls) -> "Pybind11Exporter":
+        """Return the shared exporter, creating it on first use"""
+        if cls._exporter is None:
+            from .exporter import Pybind11Exporter
+
+            cls._exporter = Pybind11Exporter()
+        return cls._exporter
+
     def add_exporter_arguments(self, arg_group: "argparse._ActionsContainer") -> None:
         """Add exporter-specific arguments to the command line"""
         arg_group.add_argument(
@@ -108,6 +128,39 @@ class Exporter(ExporterSubcommandPlugin):
                 "with clear hierarchical structure."
             ),
         )
+        arg_group.add_argument(
+            "--single-tu",
+            dest="single_tu",
+            action="store_true",
+            default=False,
+            help=(
+                "Compile split binding files as one translation unit, so the binding "
+                "library and descriptor headers are parsed once instead of once per file. "
+                "Trades parallel compilation for less total work."
+            ),
+        )
+        arg_group.add_argument(
+            "--backend",
+            dest="backend",
+            choices=BACKENDS,
+            default="pybind11",
+            help=(
+                "Binding library the generated C++ targets. nanobind needs C++17 and "
+                "produces faster-building, smaller extensions with the same Python API. "
+                "(default: pybind11)"
+            ),
+        )
+        arg_group.add_argument(
+            "--jobs",
+            dest="jobs",
+            type=int,
+            metavar="N",
+            default=1,
+            help=(
+                "Number of worker threads used to render the output files, including any "
+                "split binding files. (default: 1)"
+            ),
+        )
         arg_group.add_argument(
             "--interrupt-pattern",
             dest="interrupt_pattern",
@@ -151,7 +204,7 @@ class Exporter(ExporterSubcommandPlugin):
         if _cli.try_handle(options):
             return
 
-        exporter = Pybind11Exporter()
+        exporter = self._get_exporter()
 
         # Get soc_name from options or derive from input
         soc_name = getattr(options, "soc_name", None)
@@ -164,6 +217,9 @@ class Exporter(ExporterSubcommandPlugin):
         split_by_hierarchy = getattr(options, "split_by_hierarchy", False)
         interrupt_pattern = getattr(options, "interrupt_pattern", None)
         udp_config = getattr(options, "udp_config", None)
+        jobs = getattr(options, "jobs", 1)
+        backend = getattr(options, "backend", "pybind11")
+        single_tu = getattr(options, "single_tu", False)
 
         exporter.export(
             top_node,
@@ -175,6 +231,9 @@ class Exporter(ExporterSubcommandPlugin):
             split_by_hierarchy=split_by_hierarchy,
             interrupt_pattern=interrupt_pattern,
             udp_config=udp_config,
+            jobs=jobs,
+            backend=backend,
+            single_tu=single_tu,
         )
 
         # Run sibling-unit CLI handlers after the primary export. Order
@@ -0,0 +1,32 @@
+"""
+Constants shared by the exporter and the PeakRDL plugin entry point
+
+Kept free of jinja2 / systemrdl imports: ``__peakrdl__`` needs these while
+``peakrdl`` builds its argument parser, which happens on every ``peakrdl``
+invocation, including ones that never run this exporter.
+"""
+
+# UDPs that the exporter understands. CLI users declare these in their RDL
+# (or call ``Pybind11Exporter.register_udps(rdl_compiler)`` when invoking
+# the compiler programmatically).
+#
+# - is_flag, is_enum   (reg, bool)   : tag a register as IntFlag / IntEnum
+# - flag_disable        (field, str) : comma-separated list of bit indices
+#                                      within the field (0 = lsb) to drop
+#                                      from the generated enum/flag.
+# - flag_names          (field, str) : comma-separated identifiers, mapped
+#                                      1:1 to the bits remaining after
+#                                      flag_disable. Trailing positions
+#                                      without an entry fall back to the
+#                                      default "{field}_{i}" naming.
+_KNOWN_UDPS: tuple[tuple[str, str, type], ...] = (
+    ("is_flag", "reg", bool),
+    ("is_enum", "reg", bool),
+    ("flag_disable", "field", str),
+    ("flag_names", "field", str),
+)
+
+# Binding backends. The descriptor header, Python runtime and stubs are shared;
+# each non-default backend has its own copy of the backend templates under
+# ``templates/<backend>/``.
+BACKENDS: tuple[str, ...] = ("pybind11", "nanobind")
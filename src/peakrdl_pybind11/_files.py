@@ -0,0 +1,31 @@
+"""
+File-writing helpers shared by the exporter and its plugins
+"""
+
+import os
+from pathlib import Path
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` to ``path`` unless the file already holds exactly that
+
+    Leaving unchanged files alone keeps their mtimes, so re-exporting after
+    a small RDL edit only makes CMake/Ninja recompile the translation units
+    whose source actually changed. Changed files are written to a sibling
+    temporary file and moved into place, so an interrupted export never
+    leaves a truncated source behind. Returns whether the file was written.
+    """
+    # Same bytes a text-mode write would produce on this platform. On
+    # POSIX that is just the UTF-8 encoding, so skip the newline scan.
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
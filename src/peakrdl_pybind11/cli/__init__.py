@@ -32,6 +32,7 @@ compose with that single subcommand.
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
 import logging
 import pkgutil
@@ -50,6 +51,18 @@ __all__ = [
 
 def iter_modules() -> list[Any]:
     """Return every imported sibling-unit CLI module under this package."""
+    return list(_discover_modules())
+
+
+@functools.cache
+def _discover_modules() -> tuple[Any, ...]:
+    """Scan and import the sibling-unit CLI modules, once per process.
+
+    ``discover_subcommands``, ``try_handle`` and ``run_post_handlers`` all
+    walk the same module set during one ``peakrdl pybind11`` invocation;
+    the package contents don't change under a running process, so the
+    ``pkgutil`` directory scan is done a single time and shared.
+    """
     package_path = list(__path__)  # type: ignore[name-defined]
     package_name = __name__
     modules: list[Any] = []
@@ -61,7 +74,7 @@ def iter_modules() -> list[Any]:
             modules.append(importlib.import_module(full_name))
         except Exception:
             logger.warning("failed to import CLI module %r", full_name, exc_info=True)
-    return modules
+    return tuple(modules)
 
 
 # Legacy private alias — sibling units that imported ``_iter_modules``
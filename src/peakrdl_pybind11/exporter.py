@@ -2,14 +2,27 @@
 Main exporter implementation for PeakRDL-pybind11
 """
 
+import functools
+import inspect
 import keyword
 import os
 import re
 from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TypedDict
-
-from jinja2 import Environment, PackageLoader, select_autoescape
+from types import CodeType
+from typing import TypedDict, TypeVar
+
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    select_autoescape,
+)
+from jinja2.bccache import Bucket
 from systemrdl.node import (
     AddressableNode,
     AddrmapNode,
@@ -22,6 +35,11 @@ from systemrdl.node import (
     SignalNode,
 )
 
+from ._constants import _KNOWN_UDPS, BACKENDS
+from ._files import write_if_changed
+
+_T = TypeVar("_T")
+
 # Words that cannot be used as identifiers in either Python or C++.
 #
 # We deliberately use only ``keyword.kwlist`` (hard Python keywords) and skip
@@ -173,6 +191,61 @@ _STUB_RESERVED_NAMES: frozenset[str] = frozenset(
 
 NamedTypeKey = tuple[str, int, str]
 
+_NON_IDENTIFIER_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+# Word separators when camel-casing an RDL name into a Python identifier.
+_NAME_SEPARATORS = re.compile(r"[^a-zA-Z0-9]+")
+
+# Escapes for text embedded in a C++ "..." literal, applied in one
+# ``str.translate`` pass. Backslash, quote and the common whitespace
+# characters get their C spellings; any other control character becomes
+# ``\xNN``.
+_CPP_STRING_ESCAPES = str.maketrans(
+    {
+        **{chr(code): f"\\x{code:02x}" for code in range(0x20)},
+        "\\": "\\\\",
+        '"': '\\"',
+        "\n": "\\n",
+        "\r": "\\r",
+        "\t": "\\t",
+    }
+)
+
+# Hierarchy separators in an RDL path, mapped in one ``str.translate`` pass:
+# ``a.b[3]`` -> ``a__b_3_``.
+_PATH_TO_IDENTIFIER = str.maketrans({".": "__", "[": "_", "]": "_"})
+
+
+@functools.lru_cache(maxsize=16384)
+def _sanitize_identifier(name: str) -> str:
+    """Implementation of :meth:`Pybind11Exporter._sanitize_identifier`
+
+    Cached because the ``safe_id`` filter sanitizes the same field and
+    register names again in every template that mentions them.
+    """
+    name = _NON_IDENTIFIER_CHARS.sub("_", name)
+    if name and name[0].isdigit():
+        name = "_" + name
+    if name in _RESERVED_WORDS:
+        name = name + "_kw"
+    return name or "soc"
+
+
+@functools.lru_cache(maxsize=16384)
+def _enum_member_name(name: str) -> str:
+    """Implementation of :meth:`Pybind11Exporter._enum_member_name`
+
+    Cached because the ``enum_member`` filter converts the same encode
+    member names once per template that emits the enum.
+    """
+    parts = _NAME_SEPARATORS.split(name)
+    camel = "".join(part[:1].upper() + part[1:] for part in parts if part)
+    candidate = camel or name
+    candidate = _NON_IDENTIFIER_CHARS.sub("_", candidate)
+    if candidate and candidate[0].isdigit():
+        candidate = "_" + candidate
+    return candidate or "Field"
+
 
 class RegArrayInfo(TypedDict):
     """Metadata for an arrayed RDL register (Phase 1 of Tier 3 array support).
@@ -260,6 +333,11 @@ class Nodes(TypedDict):
     # Per-register flag/enum members: keyed by id(reg) -> [(name, value), ...].
     # Populated for entries in flag_regs and enum_regs.
     register_members: dict[int, list[tuple[str, int]]]
+    # Per-register field list: keyed by id(reg) -> the FieldNodes also
+    # collected in ``fields``. ``RegNode.fields()`` builds fresh wrappers on
+    # every call, so templates read this list (``reg | reg_fields``) rather
+    # than re-walking the register's children for every loop over it.
+    reg_fields: dict[int, list[FieldNode]]
     # Per-field RDL ``encode`` enums: keyed by field path -> [(name, value), ...].
     # Populated when a FieldNode has a non-None ``encode`` property pointing
     # at a systemrdl ``UserEnum``. Consumed by ``runtime.py.jinja`` to emit
@@ -340,27 +418,93 @@ def _compute_per_axis_strides(dimensions: list[int], inner_stride: int) -> list[
     return strides
 
 
-# UDPs that the exporter understands. CLI users declare these in their RDL
-# (or call ``Pybind11Exporter.register_udps(rdl_compiler)`` when invoking
-# the compiler programmatically).
-#
-# - is_flag, is_enum   (reg, bool)   : tag a register as IntFlag / IntEnum
-# - flag_disable        (field, str) : comma-separated list of bit indices
-#                                      within the field (0 = lsb) to drop
-#                                      from the generated enum/flag.
-# - flag_names          (field, str) : comma-separated identifiers, mapped
-#                                      1:1 to the bits remaining after
-#                                      flag_disable. Trailing positions
-#                                      without an entry fall back to the
-#                                      default "{field}_{i}" naming.
-_KNOWN_UDPS: tuple[tuple[str, str, type], ...] = (
-    ("is_flag", "reg", bool),
-    ("is_enum", "reg", bool),
-    ("flag_disable", "field", str),
-    ("flag_names", "field", str),
+def _select_entry_path() -> Callable[[Node], str]:
+    """Pick how to get a node's path without empty ``[]`` suffixes once, at import
+
+    ``get_path(empty_array_suffix="")`` drops trailing ``[]`` while leaving
+    concrete indices (``foo[3]``) intact. Older systemrdl that doesn't
+    accept the keyword gets plain ``get_path()`` with the ``[]`` stripped.
+    """
+    try:
+        params = inspect.signature(Node.get_path).parameters
+    except (TypeError, ValueError):  # pragma: no cover
+        params = {}
+    if "empty_array_suffix" in params:
+        return lambda node: node.get_path(empty_array_suffix="")
+    return lambda node: node.get_path().replace("[]", "")  # pragma: no cover - older systemrdl
+
+
+_entry_path = _select_entry_path()
+
+
+# Shared result of the ``members`` / ``field_encode_members`` filters for a
+# node without members -- by far the common case -- so those lookups don't
+# allocate a fresh empty list per register and field.
+_NO_MEMBERS: tuple[tuple[str, int], ...] = ()
+
+# Each non-default backend in ``BACKENDS`` has its own copy of the templates
+# below under ``templates/<backend>/``.
+_BACKEND_TEMPLATES: frozenset[str] = frozenset(
+    {
+        "bindings.cpp.jinja",
+        "bindings_main.cpp.jinja",
+        "bindings_chunk.cpp.jinja",
+        "CMakeLists.txt.jinja",
+        "pyproject_module.toml.jinja",
+    }
 )
 
 
+class _ProcessBytecodeCache(BytecodeCache):
+    """Keep compiled templates in memory, in front of an optional on-disk cache
+
+    Each ``Pybind11Exporter`` owns its own Jinja environment, so without
+    this every new exporter in a process would re-read and unmarshal every
+    template from disk (or recompile it). Entries are keyed like the disk
+    cache and checked against the template source's checksum.
+    """
+
+    def __init__(self, disk: BytecodeCache | None) -> None:
+        self._disk = disk
+        self._code: dict[str, tuple[str, CodeType]] = {}
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        cached = self._code.get(bucket.key)
+        if cached is not None and cached[0] == bucket.checksum:
+            bucket.code = cached[1]
+            return
+        if self._disk is not None:
+            self._disk.load_bytecode(bucket)
+            if bucket.code is not None:
+                self._code[bucket.key] = (bucket.checksum, bucket.code)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        if bucket.code is None:
+            return
+        self._code[bucket.key] = (bucket.checksum, bucket.code)
+        if self._disk is not None:
+            self._disk.dump_bytecode(bucket)
+
+
+@functools.cache
+def _bytecode_cache() -> BytecodeCache:
+    """Return the process-wide cache for compiled templates
+
+    Compiling the ~30 templates takes a few hundred milliseconds, which is
+    most of the export time for a small design. Jinja keys each entry on
+    the template source's checksum, so an upgraded package never loads
+    stale code. Compiled templates are shared in memory by every exporter
+    in the process and persisted in Jinja's per-user temp directory
+    (``_jinja2-cache-<uid>``, mode 0700); hosts where that can't be set up
+    safely only get the in-memory layer.
+    """
+    try:
+        disk: BytecodeCache | None = FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        disk = None
+    return _ProcessBytecodeCache(disk)
+
+
 class Pybind11Exporter:
     """
     Export SystemRDL register descriptions to PyBind11 C++ modules
@@ -372,9 +516,13 @@ class Pybind11Exporter:
             autoescape=select_autoescape(),
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=_bytecode_cache(),
+            # The packaged templates never change under a running exporter,
+            # so skip the per-lookup mtime check on already-loaded templates.
+            auto_reload=False,
         )
         self.env.filters["pybind_name"] = self._pybind_name_from_node
-        self.env.filters["enum_member"] = self._enum_member_name
+        self.env.filters["enum_member"] = _enum_member_name
         self.env.filters["cpp_string"] = self._cpp_string_escape
         # Reports the array-base absolute address of a node, skipping
         # per-entry stride contribution from any arrayed ancestor.
@@ -382,18 +530,31 @@ class Pybind11Exporter:
         # lineage is arrayed; falls back to ``raw_absolute_address`` as
         # soon as any ancestor is. Surfaced as a filter so the runtime
         # template can stay declarative.
+        # Keyed by ``id(node)`` with the node stored alongside, like
+        # ``_properties_by_key``.
+        self._base_addresses_by_id: dict[int, tuple[Node, int]] = {}
         self.env.filters["array_base_address"] = self._array_base_address
         # ``repr`` produces a properly-quoted, escape-safe Python literal
         # for any value — used by the signals block in ``runtime.py.jinja``
         # to inline RDL paths and UDP keys without re-implementing escape
         # logic.
         self.env.filters["python_string"] = repr
-        self.env.filters["safe_id"] = self._sanitize_identifier
+        self.env.filters["safe_id"] = _sanitize_identifier
+        # ``node | rdl_property('desc')``: memoized ``node.get_property``.
+        # The same few properties (mostly ``desc``) are read for every node
+        # by several templates, so each is resolved once per export. Keyed
+        # by ``(id(node), name)`` with the node stored alongside so its id
+        # can't be recycled.
+        self._properties_by_key: dict[tuple[int, str], tuple[Node, object]] = {}
+        self.env.filters["rdl_property"] = self._node_property
         self.env.filters["named_type"] = self._named_type_for_node
         # Lazily resolves to the (name, value) list for an is_flag / is_enum
         # register; populated by _collect_nodes.
         self._members_by_id: dict[int, list[tuple[str, int]]] = {}
         self.env.filters["members"] = self._members_for_node
+        # Per-register FieldNode list; populated by _collect_nodes.
+        self._fields_by_id: dict[int, list[FieldNode]] = {}
+        self.env.filters["reg_fields"] = self._fields_for_node
         # Per-field encode IntEnum member list; populated by _collect_nodes.
         # Keyed by ``FieldNode.get_path()`` because systemrdl returns fresh
         # FieldNode wrappers from each ``RegNode.fields()`` call — keying on
@@ -402,9 +563,17 @@ class Pybind11Exporter:
         self.env.filters["field_encode_members"] = self._field_encode_members_for_node
         self.soc_name: str | None = None
         self.soc_version: str = "0.1.0"
+        self.backend: str = "pybind11"
+        self.jobs: int = 1
+        self.single_tu: bool = False
         self.top_node: AddrmapNode | None = None
         self.output_dir: Path | None = None
         self._name_cache: dict[str, str] = {}
+        # Identifier of every node ``_collect_nodes`` returned, keyed by
+        # ``id(node)``. Templates mostly iterate those same wrappers, so a
+        # hit skips the ``get_path()`` walk that ``_name_cache`` needs.
+        # The node is stored alongside so its id can't be recycled.
+        self._names_by_id: dict[int, tuple[Node, str]] = {}
         # ``--udp-config`` declared-type map (sketch §8.2 / §18). Keys are
         # UDP attribute names; values are the *string* type name the user
         # declared (one of ``{"int", "bool", "str", "float"}``). Empty by
@@ -412,6 +581,10 @@ class Pybind11Exporter:
         # the stub side and the permissive ``TagsNamespace`` at runtime.
         self._udp_type_map: dict[str, str] = {}
         self._named_type_names: dict[NamedTypeKey, str] = {}
+        # Per-group descriptor header holding each register's class, keyed by
+        # ``id(RegNode)``. Only populated for split bindings; empty means a
+        # single ``<soc>_descriptors.hpp`` holds everything.
+        self._reg_headers: dict[int, str] = {}
 
         # Discover sibling-unit exporter plugins. Each plugin's
         # ``register(self)`` runs immediately so it can install Jinja
@@ -432,6 +605,9 @@ class Pybind11Exporter:
         split_by_hierarchy: bool = False,
         interrupt_pattern: object | None = None,
         udp_config: str | Path | None = None,
+        jobs: int = 1,
+        backend: str = "pybind11",
+        single_tu: bool = False,
     ) -> None:
         """
         Export SystemRDL to PyBind11 modules
@@ -457,7 +633,22 @@ class Pybind11Exporter:
                         default ``Any`` on ``info.tags.<udp_name>`` for type-checkers. Undeclared
                         UDPs fall back to today's permissive ``TagsNamespace``. Requires Python
                         3.11+ (uses :mod:`tomllib`); the rest of the package works on 3.10.
+            jobs: Number of worker threads used to render and write the output files
+                  (bindings, runtime, build files, stubs) and any split binding chunks.
+                  Default: 1
+            backend: Binding library the generated C++ targets, one of ``"pybind11"`` or
+                     ``"nanobind"``. nanobind needs C++17 and builds faster and smaller
+                     extensions; the Python API of the generated module is the same.
+                     Default: "pybind11"
+            single_tu: When bindings are split, also write ``<soc>_bindings_all.cpp``, which
+                       includes the main and chunk binding sources, and build only that file.
+                       The binding library and descriptor headers are then parsed once rather
+                       than once per chunk, trading parallel compilation for less total work.
+                       Has no effect when the bindings fit in one file. Default: False
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+
         self.top_node = top_node.top if isinstance(top_node, RootNode) else top_node
         self.output_dir = Path(output_dir)
         self.soc_name = soc_name or self.top_node.inst_name or "soc"
@@ -465,6 +656,9 @@ class Pybind11Exporter:
         self.split_bindings = split_bindings
         self.split_by_hierarchy = split_by_hierarchy
         self.interrupt_pattern = interrupt_pattern
+        self.jobs = max(1, jobs)
+        self.backend = backend
+        self.single_tu = single_tu
 
         # Parse the ``--udp-config`` TOML once and stash the declared-type
         # map on ``self`` so downstream consumers (currently: planned
@@ -485,31 +679,61 @@ class Pybind11Exporter:
 
         # Collect all nodes first
         nodes = self._collect_nodes(self.top_node)
-        self._finalize_named_types(nodes)
+        # Named-type protocols only appear in the .pyi stubs.
+        if gen_pyi:
+            self._finalize_named_types(nodes)
+        else:
+            self._named_type_names = {}
         self._members_by_id = nodes["register_members"]
+        self._fields_by_id = nodes["reg_fields"]
         self._field_encodes_by_path = nodes["field_encodes"]
+        self._index_node_names(nodes)
+        self._properties_by_key = {}
+        self._base_addresses_by_id = {}
 
-        # Generate C++ descriptor header
+        # Generate C++ descriptor header. Split bindings include the
+        # per-group headers it assigns, so it has to come first.
         self._generate_descriptors(nodes)
 
-        # Generate PyBind11 bindings (split if needed)
-        self._generate_bindings(nodes)
-
-        # Generate Python runtime
-        self._generate_python_runtime(nodes)
-
-        # Generate setup.py for building the module
-        self._generate_setup_py(nodes)
-
-        # Generate .pyi stub files if requested
+        # The remaining outputs only read the collected nodes: bindings
+        # (split if needed), Python runtime, build files and, if requested,
+        # .pyi stubs.
+        stages = [
+            self._generate_bindings,
+            self._generate_python_runtime,
+            self._generate_setup_py,
+        ]
         if gen_pyi:
-            self._generate_pyi_stubs(nodes)
+            stages.append(self._generate_pyi_stubs)
+        self._run_stages(stages, nodes)
 
         # Run post-export plugins (interrupt detection, schema, etc.).
         # Plugins are best-effort: a plugin failure must not stop the
         # main exporter from declaring success.
         self._run_post_export_plugins(nodes)
 
+    def _run_stages(self, stages: list[Callable[[Nodes], None]], nodes: Nodes) -> None:
+        """Run independent generation stages, on a thread pool when ``jobs > 1``
+
+        Same trade-off as :meth:`_write_binding_chunks`: rendering holds the
+        GIL, so on a regular build the threads mostly overlap one stage's
+        rendering with another's file writes.
+        """
+        self._map_jobs(lambda stage: stage(nodes), stages)
+
+    def _map_jobs(self, fn: Callable[[_T], None], items: Iterable[_T]) -> None:
+        """Call ``fn`` on every item, on a thread pool when ``jobs > 1``"""
+        work = list(items)
+        jobs = min(self.jobs, len(work))
+        if jobs <= 1:
+            for item in work:
+                fn(item)
+            return
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            # Consume the iterator so a failure in any item propagates.
+            list(pool.map(fn, work))
+
     def _run_post_export_plugins(self, nodes: "Nodes") -> None:
         from .exporter_plugins import PluginContext, run_post_export
 
@@ -532,6 +756,12 @@ class Pybind11Exporter:
 
             logging.getLogger(__name__).exception("post_export plugin failed")
 
+    def _get_template(self, name: str) -> Template:
+        """Look up a template, preferring the active backend's copy of binding templates"""
+        if self.backend != "pybind11" and name in _BACKEND_TEMPLATES:
+            return self.env.get_template(f"{self.backend}/{name}")
+        return self.env.get_template(name)
+
     def _sanitize_identifier(self, name: str) -> str:
         """Sanitize a name to be a valid Python/C++ identifier.
 
@@ -546,12 +776,7 @@ class Pybind11Exporter:
         new suffix never produces a fresh collision against a stem
         that's itself a keyword.
         """
-        name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-        if name and name[0].isdigit():
-            name = "_" + name
-        if name in _RESERVED_WORDS:
-            name = name + "_kw"
-        return name or "soc"
+        return _sanitize_identifier(name)
 
     def _pybind_name_from_node(self, value: Node | str) -> str:
         """Return a unique, sanitized identifier for a node.
@@ -564,24 +789,31 @@ class Pybind11Exporter:
         for a specific entry's identifier.
         """
         if isinstance(value, Node):
-            # ``get_path(empty_array_suffix="")`` drops trailing ``[]``
-            # while leaving concrete indices (``foo[3]``) intact. Falls
-            # back to plain ``get_path()`` on older systemrdl that
-            # doesn't accept the kwarg.
-            try:
-                path = value.get_path(empty_array_suffix="")
-            except TypeError:  # pragma: no cover - older systemrdl
-                path = value.get_path().replace("[]", "")
+            entry = self._names_by_id.get(id(value))
+            if entry is not None:
+                return entry[1]
+            path = _entry_path(value)
         else:
             path = str(value)
 
         if path not in self._name_cache:
-            sanitized_path = path.replace(".", "__").replace("[", "_").replace("]", "_")
-            self._name_cache[path] = self._sanitize_identifier(sanitized_path)
+            self._name_cache[path] = _sanitize_identifier(path.translate(_PATH_TO_IDENTIFIER))
         return self._name_cache[path]
 
-    @staticmethod
-    def _array_base_address(node: AddressableNode) -> int:
+    def _index_node_names(self, nodes: Nodes) -> None:
+        """Resolve the identifier of every collected node once, up front"""
+        self._names_by_id = {}
+        collected = [
+            *nodes["addrmaps"],
+            *nodes["regfiles"],
+            *nodes["regs"],
+            *nodes["fields"],
+            *nodes["mems"],
+            *nodes["signals"],
+        ]
+        self._names_by_id = {id(node): (node, self._pybind_name_from_node(node)) for node in collected}
+
+    def _array_base_address(self, node: AddressableNode) -> int:
         """Return the array-base absolute address of ``node``.
 
         Equivalent to ``node.absolute_address`` when neither ``node``
@@ -593,56 +825,40 @@ class Pybind11Exporter:
         ``ArrayBase`` constructor reconstructs the per-entry absolute
         offset at runtime; the runtime metadata only needs the base.
 
+        Both cases reduce to the sum of raw offsets up the lineage, so
+        each block's base is computed once and cached: a register costs
+        one lookup of its parent's base plus its own ``raw_address_offset``
+        rather than a full walk to the root per call.
+
         Used as the ``array_base_address`` Jinja filter from the
         runtime template's ``_REGISTER_INFO`` block to handle registers
         whose ancestor chain includes an arrayed regfile (Phase 2 of
         Tier 3 array support, issue #138). Phase 1 was simpler — only
         the register itself could be arrayed.
         """
-        cur: Node | None = node
-        while cur is not None:
-            if isinstance(cur, RootNode):
-                break
-            if getattr(cur, "is_array", False):
-                return int(node.raw_absolute_address)
-            cur = cur.parent
-        return int(node.absolute_address)
+        cached = self._base_addresses_by_id.get(id(node))
+        if cached is not None and cached[0] is node:
+            return cached[1]
+        address = int(node.raw_address_offset)
+        parent = node.parent
+        if isinstance(parent, AddressableNode):
+            address += self._array_base_address(parent)
+        self._base_addresses_by_id[id(node)] = (node, address)
+        return address
 
     @staticmethod
     def _cpp_string_escape(value: object) -> str:
         """Escape ``value`` so it is safe to embed inside a C++ "..." literal."""
         text = "" if value is None else str(value)
-        out: list[str] = []
-        for ch in text:
-            if ch == "\\":
-                out.append("\\\\")
-            elif ch == '"':
-                out.append('\\"')
-            elif ch == "\n":
-                out.append("\\n")
-            elif ch == "\r":
-                out.append("\\r")
-            elif ch == "\t":
-                out.append("\\t")
-            elif ord(ch) < 0x20:
-                out.append(f"\\x{ord(ch):02x}")
-            else:
-                out.append(ch)
-        return "".join(out)
+        return text.translate(_CPP_STRING_ESCAPES)
 
     def _enum_member_name(self, name: str) -> str:
         """Convert a field name into a suitable enum member name."""
-        parts = re.split(r"[^a-zA-Z0-9]+", name)
-        camel = "".join(part[:1].upper() + part[1:] for part in parts if part)
-        candidate = camel or name
-        candidate = re.sub(r"[^a-zA-Z0-9_]", "_", candidate)
-        if candidate and candidate[0].isdigit():
-            candidate = "_" + candidate
-        return candidate or "Field"
+        return _enum_member_name(name)
 
     def _python_type_name(self, type_name: str) -> str:
         """Convert an RDL type identifier into a public Python class name."""
-        parts = re.split(r"[^a-zA-Z0-9]+", type_name)
+        parts = _NAME_SEPARATORS.split(type_name)
         result = "".join(part[:1].upper() + part[1:] for part in parts if part)
         result = self._sanitize_identifier(result or "RdlType")
         if result[0].islower():
@@ -709,19 +925,114 @@ class Pybind11Exporter:
                 )
 
     def _generate_descriptors(self, nodes: Nodes) -> None:
-        """Generate C++ descriptor header file"""
+        """Generate C++ descriptor header file(s)
+
+        With split bindings, the register classes are written to one header
+        per top-level group (see ``_group_registers_by_top_level``) next to a
+        common header with the base classes, so each binding chunk only
+        parses the registers it binds. ``<soc>_descriptors.hpp`` includes all
+        of them and stays the single header user code needs.
+        """
+        assert self.output_dir is not None
+        assert self.soc_name is not None
+        groups = self._group_registers_by_top_level(nodes) if self._split_bindings_active(nodes) else {}
+        self._reg_headers = {}
+
+        if groups:
+            common = self.env.get_template("descriptors_common.hpp.jinja").render(
+                soc_name=self.soc_name,
+                top_node=self.top_node,
+                nodes=nodes,
+            )
+            write_if_changed(self.output_dir / f"{self.soc_name}_descriptors_common.hpp", common)
+
+            for header_name, (_group_path, group_regs) in groups.items():
+                for reg in group_regs:
+                    self._reg_headers[id(reg)] = header_name
+
+            group_template = self.env.get_template("descriptors_group.hpp.jinja")
+            output_dir = self.output_dir
+
+            def write_group(item: tuple[str, tuple[str, list[RegNode]]]) -> None:
+                header_name, (group_path, group_regs) = item
+                output = group_template.render(
+                    soc_name=self.soc_name,
+                    header_name=header_name,
+                    header_guard=header_name.upper().replace(".", "_"),
+                    group_path=group_path,
+                    nodes={"regs": group_regs},
+                )
+                write_if_changed(output_dir / header_name, output)
+
+            # The group headers are independent of each other; same thread
+            # pool trade-off as ``_write_binding_chunks``.
+            self._map_jobs(write_group, groups.items())
+
         template = self.env.get_template("descriptors.hpp.jinja")
 
         output = template.render(
             soc_name=self.soc_name,
             top_node=self.top_node,
             nodes=nodes,
+            group_headers=list(groups),
         )
 
-        assert self.output_dir is not None
         filepath = self.output_dir / f"{self.soc_name}_descriptors.hpp"
-        with filepath.open("w", encoding="utf-8") as f:
-            f.write(output)
+        write_if_changed(filepath, output)
+
+    def _split_bindings_active(self, nodes: Nodes) -> bool:
+        """Whether ``_generate_bindings`` will split the bindings across chunk files"""
+        if self.split_by_hierarchy:
+            # Every register lands in some hierarchy group.
+            return bool(nodes["regs"])
+        return self.split_bindings > 0 and len(nodes["regs"]) > self.split_bindings
+
+    def _group_registers_by_top_level(self, nodes: Nodes) -> dict[str, tuple[str, list[RegNode]]]:
+        """Group registers by the child of the top node they sit under
+
+        Returns ``{header_name: (group_path, regs)}`` in first-seen order, with
+        header names of the form ``<soc>_<child>_descriptors.hpp``. Registers
+        directly under the top node share ``<soc>_top_descriptors.hpp``. Empty
+        when there would be fewer than two groups, since one group header
+        would hold every register anyway.
+        """
+        assert self.top_node is not None
+        top_inst = self.top_node.inst
+        top_path = self.top_node.get_path()
+
+        by_child: dict[int, tuple[str, str, list[RegNode]]] = {}
+        for reg in nodes["regs"]:
+            # Compare instances rather than nodes: ``Node.__eq__`` builds
+            # both paths on every call.
+            child: Node = reg
+            parent = reg.parent
+            while parent is not None and parent.inst is not top_inst:
+                child = parent
+                parent = parent.parent
+            if child is reg:
+                key, group_name, group_path = 0, "top", top_path
+            else:
+                key, group_name, group_path = id(child.inst), child.inst_name, child.get_path()
+            if key not in by_child:
+                by_child[key] = (group_name, group_path, [])
+            by_child[key][2].append(reg)
+
+        if len(by_child) < 2:
+            return {}
+
+        groups: dict[str, tuple[str, list[RegNode]]] = {}
+        taken: set[str] = set()
+        for group_name, group_path, group_regs in by_child.values():
+            stem = f"{self.soc_name}_{self._sanitize_identifier(group_name)}"
+            # Headers and their include guards must stay distinct even on
+            # case-insensitive filesystems.
+            candidate, suffix = stem, 2
+            while candidate.lower() in taken:
+                candidate = f"{stem}_{suffix}"
+                suffix += 1
+            taken.add(candidate.lower())
+            groups[f"{candidate}_descriptors.hpp"] = (group_path, group_regs)
+        return groups
 
     def _generate_bindings(self, nodes: Nodes) -> None:
         """Generate PyBind11 bindings C++ file(s)"""
@@ -740,7 +1051,7 @@ class Pybind11Exporter:
 
     def _generate_single_binding(self, nodes: Nodes) -> None:
         """Generate a single bindings file"""
-        template = self.env.get_template("bindings.cpp.jinja")
+        template = self._get_template("bindings.cpp.jinja")
 
         output = template.render(
             soc_name=self.soc_name,
@@ -751,8 +1062,7 @@ class Pybind11Exporter:
 
         assert self.output_dir is not None
         filepath = self.output_dir / f"{self.soc_name}_bindings.cpp"
-        with filepath.open("w", encoding="utf-8") as f:
-            f.write(output)
+        write_if_changed(filepath, output)
 
     def _generate_split_bindings(self, nodes: Nodes) -> None:
         """Generate multiple split binding files for parallel compilation"""
@@ -761,7 +1071,7 @@ class Pybind11Exporter:
         num_chunks = (len(regs) + chunk_size - 1) // chunk_size  # Ceiling division
 
         # Generate the main module file
-        main_template = self.env.get_template("bindings_main.cpp.jinja")
+        main_template = self._get_template("bindings_main.cpp.jinja")
         main_output = main_template.render(
             soc_name=self.soc_name,
             top_node=self.top_node,
@@ -771,26 +1081,15 @@ class Pybind11Exporter:
 
         assert self.output_dir is not None
         filepath = self.output_dir / f"{self.soc_name}_bindings.cpp"
-        with filepath.open("w", encoding="utf-8") as f:
-            f.write(main_output)
+        write_if_changed(filepath, main_output)
 
         # Generate split binding files
-        chunk_template = self.env.get_template("bindings_chunk.cpp.jinja")
-
-        for chunk_idx in range(num_chunks):
-            start_idx = chunk_idx * chunk_size
-            end_idx = min(start_idx + chunk_size, len(regs))
-            chunk_regs = regs[start_idx:end_idx]
-
-            chunk_output = chunk_template.render(
-                soc_name=self.soc_name,
-                chunk_idx=chunk_idx,
-                regs=chunk_regs,
-            )
-
-            filepath = self.output_dir / f"{self.soc_name}_bindings_{chunk_idx}.cpp"
-            with filepath.open("w", encoding="utf-8") as f:
-                f.write(chunk_output)
+        self._write_binding_chunks(
+            [
+                (chunk_idx, regs[chunk_idx * chunk_size : (chunk_idx + 1) * chunk_size], None)
+                for chunk_idx in range(num_chunks)
+            ]
+        )
 
     def _generate_hierarchical_split_bindings(self, nodes: Nodes) -> None:
         """Generate split binding files organized by addrmap/regfile hierarchy"""
@@ -805,7 +1104,7 @@ class Pybind11Exporter:
         num_chunks = len(hierarchy_groups)
 
         # Generate the main module file
-        main_template = self.env.get_template("bindings_main.cpp.jinja")
+        main_template = self._get_template("bindings_main.cpp.jinja")
         main_output = main_template.render(
             soc_name=self.soc_name,
             top_node=self.top_node,
@@ -815,23 +1114,48 @@ class Pybind11Exporter:
 
         assert self.output_dir is not None
         filepath = self.output_dir / f"{self.soc_name}_bindings.cpp"
-        with filepath.open("w", encoding="utf-8") as f:
-            f.write(main_output)
+        write_if_changed(filepath, main_output)
 
         # Generate split binding files for each hierarchy group
-        chunk_template = self.env.get_template("bindings_chunk.cpp.jinja")
+        self._write_binding_chunks(
+            [
+                (chunk_idx, group_regs, group_name)
+                for chunk_idx, (group_name, group_regs) in enumerate(hierarchy_groups.items())
+            ]
+        )
 
-        for chunk_idx, (group_name, group_regs) in enumerate(hierarchy_groups.items()):
+    def _write_binding_chunks(self, chunks: list[tuple[int, list[RegNode], str | None]]) -> None:
+        """Render and write one ``{soc_name}_bindings_{idx}.cpp`` per ``(idx, regs, name)`` chunk
+
+        Chunks are independent of each other, so with ``jobs > 1`` they are
+        rendered on a thread pool. Rendering holds the GIL, so the overlap
+        is mostly with file I/O on a regular build and becomes real
+        parallelism on a free-threaded interpreter. The node tree and the
+        exporter-bound template filters can't be pickled, which rules out a
+        process pool.
+        """
+        chunk_template = self._get_template("bindings_chunk.cpp.jinja")
+        assert self.output_dir is not None
+        output_dir = self.output_dir
+        reg_headers = self._reg_headers
+
+        def write_chunk(chunk: tuple[int, list[RegNode], str | None]) -> None:
+            chunk_idx, chunk_regs, chunk_name = chunk
             chunk_output = chunk_template.render(
                 soc_name=self.soc_name,
                 chunk_idx=chunk_idx,
-                regs=group_regs,
-                chunk_name=group_name,  # Optional: for documentation/comments
+                regs=chunk_regs,
+                chunk_name=chunk_name,  # Optional: for documentation/comments
+                # Only the group headers this chunk's registers live in.
+                descriptor_headers=list(dict.fromkeys(reg_headers[id(reg)] for reg in chunk_regs))
+                if reg_headers
+                else [],
             )
 
-            filepath = self.output_dir / f"{self.soc_name}_bindings_{chunk_idx}.cpp"
-            with filepath.open("w", encoding="utf-8") as f:
-                f.write(chunk_output)
+            filepath = output_dir / f"{self.soc_name}_bindings_{chunk_idx}.cpp"
+            write_if_changed(filepath, chunk_output)
+
+        self._map_jobs(write_chunk, chunks)
 
     def _group_registers_by_hierarchy(self, nodes: Nodes) -> OrderedDict[str, list[RegNode]]:
         """Group registers by their parent addrmap or regfile for hierarchical splitting
@@ -897,8 +1221,7 @@ class Pybind11Exporter:
         pkg_dir = self.output_dir / self.soc_name
         pkg_dir.mkdir(exist_ok=True)
         for filepath in (pkg_dir / "__init__.py", self.output_dir / "__init__.py"):
-            with filepath.open("w", encoding="utf-8") as f:
-                f.write(output)
+            write_if_changed(filepath, output)
 
     def _generate_setup_py(self, nodes: Nodes) -> None:
         """Generate CMakeLists.txt and pyproject.toml for building the C++ extension"""
@@ -927,25 +1250,36 @@ class Pybind11Exporter:
             source_files = [f"{self.soc_name}_bindings.cpp"]
 
         assert self.output_dir is not None
+        if self.single_tu and len(source_files) > 1:
+            # Compile the split sources through one translation unit.
+            all_template = self.env.get_template("bindings_all.cpp.jinja")
+            all_output = all_template.render(soc_name=self.soc_name, sources=source_files)
+            all_filename = f"{self.soc_name}_bindings_all.cpp"
+            write_if_changed(self.output_dir / all_filename, all_output)
+            source_files = [all_filename]
+
         # Generate CMakeLists.txt
-        cmake_template = self.env.get_template("CMakeLists.txt.jinja")
+        cmake_template = self._get_template("CMakeLists.txt.jinja")
         cmake_output = cmake_template.render(
             soc_name=self.soc_name,
             source_files=source_files,
+            # With per-group descriptor headers, precompile only the common
+            # part every translation unit includes.
+            pch_header=f"{self.soc_name}_descriptors_common.hpp"
+            if self._reg_headers
+            else f"{self.soc_name}_descriptors.hpp",
         )
         cmake_filepath = self.output_dir / "CMakeLists.txt"
-        with cmake_filepath.open("w", encoding="utf-8") as f:
-            f.write(cmake_output)
+        write_if_changed(cmake_filepath, cmake_output)
 
         # Generate pyproject.toml for the module
-        pyproject_template = self.env.get_template("pyproject_module.toml.jinja")
+        pyproject_template = self._get_template("pyproject_module.toml.jinja")
         pyproject_output = pyproject_template.render(
             soc_name=self.soc_name,
             soc_version=self.soc_version,
         )
         pyproject_filepath = self.output_dir / "pyproject.toml"
-        with pyproject_filepath.open("w", encoding="utf-8") as f:
-            f.write(pyproject_output)
+        write_if_changed(pyproject_filepath, pyproject_output)
 
     def _generate_pyi_stubs(self, nodes: Nodes) -> None:
         """Generate .pyi stub files for type hints"""
@@ -968,11 +1302,16 @@ class Pybind11Exporter:
         pkg_dir = self.output_dir / self.soc_name
         pkg_dir.mkdir(exist_ok=True)
         for filepath in (pkg_dir / "__init__.pyi", self.output_dir / "__init__.pyi"):
-            with filepath.open("w", encoding="utf-8") as f:
-                f.write(output)
+            write_if_changed(filepath, output)
 
     def _collect_nodes(self, node: Node, nodes: Nodes | None = None) -> Nodes:
-        """Recursively collect all nodes in the hierarchy"""
+        """Collect all nodes in the hierarchy, in depth-first pre-order
+
+        Walks an explicit stack rather than recursing, so deep regfile
+        nesting costs no Python frames and can't hit the recursion limit.
+        Children are pushed in reverse, so every list fills in the same
+        order a recursive walk would give.
+        """
         if nodes is None:
             nodes = {
                 "addrmaps": [],
@@ -984,13 +1323,28 @@ class Pybind11Exporter:
                 "enum_regs": [],
                 "signals": [],
                 "register_members": {},
+                "reg_fields": {},
                 "field_encodes": {},
                 "arrays": [],
                 "reg_arrays": [],
                 "named_types": [],
             }
 
-        if isinstance(node, AddrmapNode):
+        stack: list[Node] = [node]
+        while stack:
+            node = stack.pop()
+            self._collect_node(node, nodes, stack)
+
+        return nodes
+
+    def _collect_node(self, node: Node, nodes: Nodes, stack: list[Node]) -> None:
+        """Record one node for :meth:`_collect_nodes` and push its children onto ``stack``"""
+        if isinstance(node, SignalNode):
+            # ``SignalNode`` children of an addrmap/regfile have no
+            # relevant descendants for us; track them flat. They go
+            # through the stack so they keep their place in the walk.
+            nodes["signals"].append(node)
+        elif isinstance(node, AddrmapNode):
             # Arrayed addrmap (issues #137 / #138 follow-up). Treated as
             # the regfile-array path's twin — same ``ArrayInfo`` shape,
             # same ``ArrayBase<entry_t>`` C++ codegen, but with
@@ -1021,14 +1375,7 @@ class Pybind11Exporter:
             # registers / regfiles get a bound index for their own
             # ``address_offset``. Required so each child's C++ class
             # is emitted exactly once regardless of array size.
-            for child in node.children():
-                # ``SignalNode`` children of an addrmap/regfile have no
-                # relevant descendants for us; track them flat and skip
-                # the recursive descent the other kinds use.
-                if isinstance(child, SignalNode):
-                    nodes["signals"].append(child)
-                    continue
-                self._collect_nodes(child, nodes)
+            stack.extend(reversed(list(node.children())))
         elif isinstance(node, RegfileNode):
             # Detect arrayed regfiles (Phase 2 of Tier 3). Phase 3 (#138)
             # extends to multi-dim — nested ``ArrayBase<ArrayBase<...>>``
@@ -1068,17 +1415,12 @@ class Pybind11Exporter:
             # registers' ``address_offset`` works as on a non-arrayed
             # regfile. Required so each child register's C++ class is
             # emitted exactly once.
-            for child in node.children():
-                if isinstance(child, SignalNode):
-                    nodes["signals"].append(child)
-                    continue
-                self._collect_nodes(child, nodes)
+            stack.extend(reversed(list(node.children())))
         elif isinstance(node, MemNode):
             children = list(node.children())
             if children:
                 nodes["mems"].append(node)
-                for child in children:
-                    self._collect_nodes(child, nodes)
+                stack.extend(reversed(children))
         elif isinstance(node, RegNode):
             # Detect arrayed registers (Phase 1+3 of Tier 3). 1-D arrays
             # produce a single ``ArrayBase<entry_t>`` subclass; N-dim
@@ -1136,8 +1478,11 @@ class Pybind11Exporter:
             elif is_enum:
                 nodes["enum_regs"].append(node)
                 nodes["register_members"][id(node)] = self._register_member_layout(node)
-            for field in node.fields():
-                nodes["fields"].append(field)
+            reg_fields = list(node.fields())
+            nodes["reg_fields"][id(node)] = reg_fields
+            nodes["fields"].extend(reg_fields)
+            field_encodes = nodes["field_encodes"]
+            for field in reg_fields:
                 # Per-field RDL ``encode`` UDP (sketch §8.1). The property
                 # returns a ``UserEnum`` subclass whose ``.members`` is an
                 # ordered dict of ``name -> UserEnumMember``. Coerce to a
@@ -1150,12 +1495,10 @@ class Pybind11Exporter:
                 if enc is not None:
                     members = getattr(enc, "members", None)
                     if members:
-                        nodes["field_encodes"][field.get_path()] = [
+                        field_encodes[field.get_path()] = [
                             (str(name), int(member.value)) for name, member in members.items()
                         ]
 
-        return nodes
-
     def _get_bool_property(self, node: Node, name: str) -> bool:
         """Safely read a boolean property from a node."""
         try:
@@ -1164,21 +1507,45 @@ class Pybind11Exporter:
             return False
         return bool(value)
 
-    def _members_for_node(self, node: Node) -> list[tuple[str, int]]:
+    def _node_property(self, node: Node, name: str) -> object:
+        """Jinja filter: ``node.get_property(name)``, resolved once per node and property"""
+        key = (id(node), name)
+        entry = self._properties_by_key.get(key)
+        if entry is not None:
+            return entry[1]
+        value = node.get_property(name)
+        self._properties_by_key[key] = (node, value)
+        return value
+
+    def _members_for_node(self, node: Node) -> Sequence[tuple[str, int]]:
         """Jinja filter: return the (name, value) members for a flag/enum reg."""
-        return self._members_by_id.get(id(node), [])
+        return self._members_by_id.get(id(node), _NO_MEMBERS)
+
+    def _fields_for_node(self, node: RegNode) -> list[FieldNode]:
+        """Jinja filter: return a register's fields, in ``RegNode.fields()`` order.
+
+        Registers from ``_collect_nodes`` reuse the list collected there;
+        any other wrapper (e.g. one reached through ``children()``) falls
+        back to a fresh ``fields()`` walk.
+        """
+        fields = self._fields_by_id.get(id(node))
+        if fields is None:
+            return list(node.fields())
+        return fields
 
-    def _field_encode_members_for_node(self, node: Node) -> list[tuple[str, int]]:
+    def _field_encode_members_for_node(self, node: Node) -> Sequence[tuple[str, int]]:
         """Jinja filter: return the IntEnum members for a field with RDL ``encode``.
 
-        Returns ``[]`` when the field has no encode — that's the signal the
+        Returns an empty sequence when the field has no encode — that's the signal the
         template uses to decide whether to emit the per-field enum class.
 
         Lookup is by ``node.get_path()`` because systemrdl's
         ``RegNode.fields()`` returns fresh FieldNode wrappers per call;
         keying on ``id(node)`` would always miss the template-side lookups.
         """
-        return self._field_encodes_by_path.get(node.get_path(), [])
+        if not self._field_encodes_by_path:
+            return _NO_MEMBERS
+        return self._field_encodes_by_path.get(node.get_path(), _NO_MEMBERS)
 
     @staticmethod
     def _get_string_property(node: Node, name: str) -> str | None:
@@ -85,6 +85,11 @@ class PluginContext:
 
 
 _plugin_instances: list[Any] = []
+# Instance registered for each discovered plugin module, by module name.
+# ``discover_plugins`` runs once per exporter; this keeps a long-lived
+# process from accumulating one instance per exporter it ever created, each
+# of which would redo the full post-export tree walk on every export.
+_module_plugins: dict[str, Any] = {}
 
 
 def register_plugin(plugin: Any) -> Any:
@@ -117,7 +122,8 @@ def discover_plugins(exporter: Any = None) -> list[Any]:
     1. Import the module (skipping underscore-prefixed reserved names).
     2. Call its ``register(exporter)`` if present. The return value, if
        not ``None``, is treated as a plugin instance and added to the
-       post-export registry.
+       post-export registry. ``register`` runs for every exporter, but
+       only the first instance a module returns is kept.
 
     Returns the list of registered plugin instances (post this call) so
     test code can introspect what was discovered without needing access
@@ -145,7 +151,9 @@ def discover_plugins(exporter: Any = None) -> list[Any]:
         except Exception:
             logger.warning("exporter plugin %r register() raised", full_name, exc_info=True)
             continue
-        register_plugin(result)
+        if result is None or full_name in _module_plugins:
+            continue
+        _module_plugins[full_name] = register_plugin(result)
 
     return registered_plugins()
 
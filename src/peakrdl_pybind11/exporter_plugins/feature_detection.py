@@ -29,6 +29,7 @@ the ``--interrupt-pattern`` flag through.
 
 from __future__ import annotations
 
+import inspect
 import json
 import logging
 import pprint
@@ -49,6 +50,8 @@ from systemrdl.node import (
     RootNode,
 )
 
+from peakrdl_pybind11._files import write_if_changed
+
 if TYPE_CHECKING:
     from peakrdl_pybind11.exporter_plugins import PluginContext
 
@@ -78,7 +81,7 @@ PARTNER_SUFFIXES: tuple[tuple[str, tuple[str, ...]], ...] = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InterruptGroup:
     """Detected interrupt trio. Serialised into ``interrupts_detected.py``."""
 
@@ -225,16 +228,31 @@ def _shared_field_names(*regs: RegNode | None) -> list[str]:
     return [name for name in state_fields if name in common]
 
 
+def _registers_under(top_node: AddrmapNode, regs: Iterable[RegNode] | None) -> Iterable[RegNode]:
+    """``regs`` if the caller already has them, else every register below ``top_node``
+
+    The exporter hands over the flat register list it collected, which
+    saves re-walking the tree -- including a fresh wrapper per field --
+    for every detector.
+    """
+    if regs is not None:
+        return regs
+    return [node for node in top_node.descendants() if isinstance(node, RegNode)]
+
+
 def detect_interrupt_groups(
     top_node: AddrmapNode,
     pattern: object | None = None,
+    regs: Iterable[RegNode] | None = None,
 ) -> list[InterruptGroup]:
-    """Walk ``top_node`` and return every detected interrupt trio."""
+    """Walk ``top_node`` and return every detected interrupt trio.
+
+    ``regs`` optionally supplies the registers under ``top_node`` (in
+    tree order) so the tree isn't walked again.
+    """
     predicate = _normalise_pattern(pattern)
     groups: list[InterruptGroup] = []
-    for node in top_node.descendants():
-        if not isinstance(node, RegNode):
-            continue
+    for node in _registers_under(top_node, regs):
         if not predicate(node.inst_name):
             continue
         if not _all_fields_intr(node):
@@ -280,12 +298,13 @@ def _path_or_none(reg: RegNode | None) -> str | None:
 # ---------------------------------------------------------------------------
 
 
-def detect_aliases(top_node: AddrmapNode) -> dict[str, str]:
-    """Return ``{alias_path: primary_path}`` for every aliased register."""
+def detect_aliases(top_node: AddrmapNode, regs: Iterable[RegNode] | None = None) -> dict[str, str]:
+    """Return ``{alias_path: primary_path}`` for every aliased register.
+
+    ``regs`` is as for :func:`detect_interrupt_groups`.
+    """
     aliases: dict[str, str] = {}
-    for node in top_node.descendants():
-        if not isinstance(node, RegNode):
-            continue
+    for node in _registers_under(top_node, regs):
         if not getattr(node, "is_alias", False):
             continue
         try:
@@ -347,7 +366,7 @@ def _resolve_array_base_address(node: AddressableNode) -> int:
     while cur is not None:
         if isinstance(cur, RootNode):
             break
-        if getattr(cur, "is_array", False):
+        if cast(AddressableNode, cur).is_array:
             return int(node.raw_absolute_address)
         cur = cur.parent
     return int(node.absolute_address)
@@ -361,6 +380,26 @@ def _safe_property(node: Node, name: str) -> Any | None:
     return _to_jsonable(value)
 
 
+# ``(node class, property)`` pairs whose built-in property does not bind to
+# that component type. Bindability of native properties is fixed by the
+# SystemRDL spec, so each miss is learned once instead of raising again for
+# every register (``addressing``/``alignment`` on a ``reg``, say).
+_UNBOUND_NATIVE_PROPS: set[tuple[type[Node], str]] = set()
+
+
+def _native_property(node: Node, name: str) -> Any | None:
+    """:func:`_safe_property` for built-in (non-UDP) property names."""
+    key = (type(node), name)
+    if key in _UNBOUND_NATIVE_PROPS:
+        return None
+    try:
+        value = node.get_property(name)
+    except LookupError:
+        _UNBOUND_NATIVE_PROPS.add(key)
+        return None
+    return _to_jsonable(value)
+
+
 def _to_jsonable(value: Any) -> Any:
     """Coerce a value into something ``json.dumps`` can handle.
 
@@ -379,22 +418,28 @@ def _to_jsonable(value: Any) -> Any:
     return str(value)
 
 
+def _select_udp_lister() -> Callable[[Node], Iterable[str]]:
+    """Pick how to list a node's UDP names once, at import.
+
+    The systemrdl public API exposes user-defined properties via the
+    node's ``list_properties(only_udp=True)``; versions whose
+    ``list_properties`` lacks that keyword get an empty listing, as before.
+    """
+    try:
+        params = inspect.signature(Node.list_properties).parameters
+    except (AttributeError, TypeError, ValueError):  # pragma: no cover
+        params = {}
+    if "only_udp" in params:
+        return lambda node: cast(Iterable[str], node.list_properties(only_udp=True))  # type: ignore[call-arg]
+    return lambda node: ()
+
+
+_list_udps = _select_udp_lister()
+
+
 def _udp_dict(node: Node) -> dict[str, Any]:
     """Dump every UDP attached to ``node`` as JSON-friendly values."""
-    udps: dict[str, Any] = {}
-    # The systemrdl public API exposes user-defined properties via the
-    # node's ``list_properties(only_udp=True)``; fall back gracefully for
-    # older versions.
-    list_props = getattr(node, "list_properties", None)
-    if not callable(list_props):
-        return udps
-    try:
-        names = cast(Iterable[str], list_props(only_udp=True))
-    except TypeError:  # pragma: no cover - older systemrdl versions
-        names = ()
-    for name in names:
-        udps[name] = _safe_property(node, name)
-    return udps
+    return {name: _safe_property(node, name) for name in _list_udps(node)}
 
 
 def _field_to_dict(field_node: FieldNode) -> dict[str, Any]:
@@ -411,10 +456,10 @@ def _field_to_dict(field_node: FieldNode) -> dict[str, Any]:
         "is_sw_writable": field_node.is_sw_writable,
         "is_hw_readable": field_node.is_hw_readable,
         "is_hw_writable": field_node.is_hw_writable,
-        "reset": _safe_property(field_node, "reset"),
+        "reset": _native_property(field_node, "reset"),
     }
     for prop in _FIELD_PROPS:
-        out[prop] = _safe_property(field_node, prop)
+        out[prop] = _native_property(field_node, prop)
     udps = _udp_dict(field_node)
     if udps:
         out["udps"] = udps
@@ -436,7 +481,7 @@ def _reg_to_dict(reg: RegNode) -> dict[str, Any]:
         "path": reg.get_path(),
         "absolute_address": absolute_address,
         "size": reg.size,
-        "is_alias": getattr(reg, "is_alias", False),
+        "is_alias": reg.is_alias,
         "fields": [_field_to_dict(f) for f in reg.fields()],
     }
     if reg.is_array:
@@ -454,7 +499,7 @@ def _reg_to_dict(reg: RegNode) -> dict[str, Any]:
             primary = None
         out["alias_primary"] = primary.get_path() if primary is not None else None
     for prop in _REG_PROPS:
-        out[prop] = _safe_property(reg, prop)
+        out[prop] = _native_property(reg, prop)
     udps = _udp_dict(reg)
     if udps:
         out["udps"] = udps
@@ -471,7 +516,7 @@ def _mem_to_dict(mem: MemNode) -> dict[str, Any]:
         "children": [_node_to_dict(c) for c in mem.children()],
     }
     for prop in _MEM_PROPS:
-        out[prop] = _safe_property(mem, prop)
+        out[prop] = _native_property(mem, prop)
     return out
 
 
@@ -479,18 +524,17 @@ def _container_to_dict(node: AddrmapNode | RegfileNode) -> dict[str, Any]:
     # ``absolute_address`` also raises on non-array containers below an
     # arrayed ancestor, so resolve the whole lineage rather than checking
     # only this node.
-    is_array = bool(getattr(node, "is_array", False))
     out: dict[str, Any] = {
         "kind": "addrmap" if isinstance(node, AddrmapNode) else "regfile",
         "inst_name": node.inst_name,
         "path": node.get_path(),
         "absolute_address": _resolve_array_base_address(node),
         "size": node.size,
-        "name": _safe_property(node, "name"),
-        "desc": _safe_property(node, "desc"),
+        "name": _native_property(node, "name"),
+        "desc": _native_property(node, "desc"),
         "children": [_node_to_dict(c) for c in node.children()],
     }
-    if is_array:
+    if node.is_array:
         out["array_dimensions"] = list(node.array_dimensions or [])
         stride = node.array_stride
         out["array_stride"] = int(stride) if stride is not None else int(node.size)
@@ -592,7 +636,7 @@ def enrich_stubs(stubs_path: Path, regs: Iterable[RegNode], pybind_name_for: Cal
                 _STUBS_END,
             ]
         )
-        stubs_path.write_text(text.rstrip() + "\n\n" + block + "\n", encoding="utf-8")
+        write_if_changed(stubs_path, text.rstrip() + "\n\n" + block + "\n")
         return
     text = _strip_existing_block(text)
 
@@ -639,7 +683,7 @@ def enrich_stubs(stubs_path: Path, regs: Iterable[RegNode], pybind_name_for: Cal
     block_lines.append(_STUBS_END)
 
     new_text = text.rstrip() + "\n\n" + "\n".join(block_lines) + "\n"
-    stubs_path.write_text(new_text, encoding="utf-8")
+    write_if_changed(stubs_path, new_text)
 
 
 def _strip_existing_block(text: str) -> str:
@@ -651,7 +695,7 @@ def _strip_existing_block(text: str) -> str:
 
 
 # ---------------------------------------------------------------------------
-# Output writers
+# Output rendering
 # ---------------------------------------------------------------------------
 
 
@@ -661,27 +705,25 @@ def _format_python_literal(value: Any) -> str:
     return pprint.pformat(value, indent=2, width=88, sort_dicts=False)
 
 
-def _write_interrupts(path: Path, groups: Iterable[InterruptGroup]) -> None:
+def _interrupts_source(groups: Iterable[InterruptGroup]) -> str:
     payload = [g.to_dict() for g in groups]
-    text = (
+    return (
         '"""Auto-generated by peakrdl_pybind11.exporter_plugins.feature_detection."""\n\n'
         "from __future__ import annotations\n\n"
         f"interrupt_groups: list[dict] = {_format_python_literal(payload)}\n"
     )
-    path.write_text(text, encoding="utf-8")
 
 
-def _write_aliases(path: Path, aliases: Mapping[str, str]) -> None:
-    text = (
+def _aliases_source(aliases: Mapping[str, str]) -> str:
+    return (
         '"""Auto-generated by peakrdl_pybind11.exporter_plugins.feature_detection."""\n\n'
         "from __future__ import annotations\n\n"
         f"aliases: dict[str, str] = {_format_python_literal(dict(aliases))}\n"
     )
-    path.write_text(text, encoding="utf-8")
 
 
-def _write_schema(path: Path, schema: Mapping[str, Any]) -> None:
-    path.write_text(json.dumps(schema, indent=2, default=str), encoding="utf-8")
+def _schema_json(schema: Mapping[str, Any]) -> str:
+    return json.dumps(schema, indent=2, default=str)
 
 
 # ---------------------------------------------------------------------------
@@ -700,22 +742,30 @@ class FeatureDetectionPlugin:
         # the package root.
         targets = _output_targets(ctx.output_dir, ctx.soc_name)
 
-        pattern = ctx.options.get("interrupt_pattern")
-        groups = detect_interrupt_groups(top, pattern)
-        aliases = detect_aliases(top)
-        schema = build_schema(top)
+        try:
+            regs = ctx.nodes["regs"]
+        except (KeyError, TypeError):
+            regs = None
 
+        pattern = ctx.options.get("interrupt_pattern")
+        groups = detect_interrupt_groups(top, pattern, regs)
+        aliases = detect_aliases(top, regs)
+
+        # Render each file once; both targets get the same buffer. The
+        # schema dict is only referenced for the duration of the dump, so
+        # it is freed before the files are written instead of being held
+        # alongside its JSON text.
+        outputs = {
+            "interrupts_detected.py": _interrupts_source(groups),
+            "aliases.py": _aliases_source(aliases),
+            "schema.json": _schema_json(build_schema(top)),
+        }
         for target in targets:
             target.mkdir(parents=True, exist_ok=True)
-            _write_interrupts(target / "interrupts_detected.py", groups)
-            _write_aliases(target / "aliases.py", aliases)
-            _write_schema(target / "schema.json", schema)
+            for filename, text in outputs.items():
+                write_if_changed(target / filename, text)
 
         # Stubs enrichment: rewrite both copies of ``__init__.pyi``.
-        try:
-            regs = ctx.nodes["regs"]
-        except (KeyError, TypeError):
-            regs = []
         if regs:
             for stubs_dir in targets:
                 enrich_stubs(
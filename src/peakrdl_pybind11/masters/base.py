@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessOp:
     """One register-access operation used by batched ``read_many`` /
     ``write_many``.
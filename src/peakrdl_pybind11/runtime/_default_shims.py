@@ -237,11 +237,15 @@ def _make_write_fields(
 
     _ = readable_spec  # unused on the write path; kept in the signature for symmetry.
 
+    # ``(lsb, lsb-shifted mask)`` per field, computed once per register
+    # class instead of on every ``write_fields`` call.
+    field_masks = {name: (lsb, ((1 << width) - 1) << lsb) for name, (lsb, width) in fields_spec.items()}
+
     def write_fields(self: Any, **kwargs: Any) -> None:
         combined_mask = 0
         combined_value = 0
         for name, raw_value in kwargs.items():
-            spec = fields_spec.get(name)
+            spec = field_masks.get(name)
             if spec is None:
                 # Per sketch §19 matrix: an unknown field name passed to
                 # ``modify(**kwargs)`` (which routes through this shim)
@@ -267,8 +271,7 @@ def _make_write_fields(
                     f"{self.name}.{name}",
                     _field_access_mode(read_ok, False),
                 )
-            lsb, width = spec
-            field_mask = ((1 << width) - 1) << lsb
+            lsb, field_mask = spec
             combined_mask |= field_mask
             combined_value |= (int(raw_value) << lsb) & field_mask
         # Single C++ entry: native RMW under the hood.
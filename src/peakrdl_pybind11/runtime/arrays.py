@@ -230,8 +230,7 @@ class _FieldProjection:
 
     def modify(self, **fields: Any) -> None:
         """Issue ``N`` read-modify-writes -- one per element."""
-        elements = list(self._view._iter_elements())
-        for el in elements:
+        for el in self._view._iter_elements():
             target = _resolve_attr_path(el, self._path)
             target.modify(**fields)
 
@@ -620,13 +619,17 @@ class ArrayView:
             [(name, np.bool_ if w == 1 else np.uint64) for name, (_lsb, w) in field_spec.items()]
         )
 
+        # Gather the raw register words once, then slice every field out
+        # of the whole array with vectorised shift/mask ops instead of
+        # building a Python tuple per element.
+        raw = np.fromiter(
+            (int(el.read() if hasattr(el, "read") else el) for el in elements),
+            dtype=np.uint64,
+            count=len(elements),
+        ).reshape(self._shape)
         result = np.empty(self._shape, dtype=dtype)
-        flat = result.reshape(-1)
-        for i, el in enumerate(elements):
-            value = el.read() if hasattr(el, "read") else el
-            iv = int(value)
-            row = tuple((iv >> lsb) & ((1 << width) - 1) for lsb, width in field_spec.values())
-            flat[i] = row
+        for name, (lsb, width) in field_spec.items():
+            result[name] = (raw >> np.uint64(lsb)) & np.uint64((1 << width) - 1)
         return result
 
     def _discover_field_spec(self, element: Any) -> dict[str, tuple[int, int]]:
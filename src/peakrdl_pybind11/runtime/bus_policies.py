@@ -176,7 +176,7 @@ class BarrierPolicy:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class _CacheEntry:
     """Per-address cache slot."""
 
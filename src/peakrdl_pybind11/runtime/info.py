@@ -20,6 +20,7 @@ degrades to a defaulted :class:`Info` (useful for stubs and tests).
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -60,6 +61,11 @@ class AccessMode(str, Enum):
         return self.value
 
 
+# ``AccessMode`` member per lowercase token, for coercing raw ``access``
+# strings without going through ``Enum`` lookup machinery.
+_ACCESS_MODES: dict[str, AccessMode] = {mode.value: mode for mode in AccessMode}
+
+
 class TagsNamespace(SimpleNamespace):
     """Permissive attribute namespace for user-defined properties (UDPs).
 
@@ -169,8 +175,10 @@ class Info:
         # ``str`` Enum equality means downstream string comparisons keep
         # working, but type checkers and ``isinstance`` checks see the
         # structured form.
-        if isinstance(self.access, str) and not isinstance(self.access, AccessMode):
-            mapped = AccessMode._value2member_map_.get(self.access.lower())
+        access = self.access
+        if isinstance(access, str) and not isinstance(access, AccessMode):
+            # Extracted tokens are already lowercase; only lower on a miss.
+            mapped = _ACCESS_MODES.get(access) or _ACCESS_MODES.get(access.lower())
             if mapped is not None:
                 object.__setattr__(self, "access", mapped)
 
@@ -254,10 +262,29 @@ def _safe_get_property(node: Any, prop: str, default: Any = None) -> object:
         return default
 
 
+# Lowercase token per RDL enum member (``AccessType.rw`` -> ``"rw"``),
+# keyed by ``id()`` because ``Enum.__hash__`` runs in Python. The same few
+# members recur on every field of a large map, so each is lowered once.
+# The member is stored alongside so its id can't be recycled.
+_ENUM_TOKENS: dict[int, tuple[Enum, str]] = {}
+
+
 def _coerce_str(value: Any) -> str | None:
     """Coerce an RDL property to a lowercase token, or ``None``."""
     if value is None:
         return None
+    if type(value) is str:
+        return value.lower()
+    hit = _ENUM_TOKENS.get(id(value))
+    if hit is not None:
+        return hit[1]
+    token = _coerce_str_slow(value)
+    if isinstance(value, Enum):
+        _ENUM_TOKENS[id(value)] = (value, token)
+    return token
+
+
+def _coerce_str_slow(value: Any) -> str:
     name = getattr(value, "name", None)
     if isinstance(name, str):
         return name.lower()
@@ -621,9 +648,14 @@ else:
                     if isinstance(fspec, tuple) and len(fspec) == 2:
                         lsb, width = fspec
                         fmeta = field_info_meta.get(fname, {}) if isinstance(field_info_meta, dict) else {}
+                        # Every entry of a register array rebuilds these
+                        # from the same class meta; intern the synthesized
+                        # path so the entries share one string and the
+                        # path-keyed maps (snapshots, observers) compare
+                        # by identity first.
                         fields[fname] = Info(
                             name=fname,
-                            path=fmeta.get("path", f"{reg_path}.{fname}"),
+                            path=fmeta["path"] if "path" in fmeta else sys.intern(f"{reg_path}.{fname}"),
                             offset=lsb,
                             regwidth=width,
                             on_read=fmeta.get("on_read"),
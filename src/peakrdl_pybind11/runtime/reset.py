@@ -231,20 +231,21 @@ def _looks_like_container(value: Any) -> bool:
     return False
 
 
-def _iter_children(node: Any) -> Iterator[Any]:
-    """Yield duck-typed child nodes of ``node``."""
+def _iter_children(node: Any) -> list[Any]:
+    """List duck-typed child nodes of ``node``."""
 
     try:
         items = vars(node)
     except TypeError:
-        return
-    for name, value in items.items():
-        if name.startswith("_") or name in ("parent", "master", "info"):
-            continue
-        if value is node:
-            continue
-        if _looks_like_container(value):
-            yield value
+        return []
+    return [
+        value
+        for name, value in items.items()
+        if not name.startswith("_")
+        and name not in ("parent", "master", "info")
+        and value is not node
+        and _looks_like_container(value)
+    ]
 
 
 def _walk_subtree(root: Any) -> Iterator[Any]:
@@ -286,9 +287,7 @@ def _walk_subtree(root: Any) -> Iterator[Any]:
             continue
         visited.add(key)
         yield cur
-        children = list(_iter_children(cur))
-        for child in reversed(children):
-            stack.append(child)
+        stack.extend(reversed(_iter_children(cur)))
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +38,9 @@ the definition here will be replaced by a re-export.
 from __future__ import annotations
 
 import fnmatch
+import functools
+import operator
+import weakref
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from enum import IntEnum
@@ -120,7 +123,7 @@ class RoutingError(LookupError):
         super().__init__(message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Range:
     """Half-open ``[start, end)`` address range."""
 
@@ -363,6 +366,42 @@ class Router:
 _CHILD_ATTR_HINTS = ("read", "write", "bits", "lsb", "offset", "info")
 
 
+@functools.cache
+def _signal_type() -> type:
+    """:class:`~peakrdl_pybind11.runtime.signals.Signal`, imported on first use.
+
+    The walk helpers classify every node they visit; caching the lazy
+    import keeps that to a call instead of an ``import`` statement.
+    """
+    from .signals import Signal
+
+    return Signal
+
+
+@functools.cache
+def _array_view_type() -> type:
+    """:class:`~peakrdl_pybind11.runtime.arrays.ArrayView`, imported on first use."""
+    from .arrays import ArrayView
+
+    return ArrayView
+
+
+# Lower-cased class name per class, for the name-based tests in
+# :func:`_kind_for` and :func:`_matches_kind`. A walk meets the same few
+# generated classes over and over, so each name is lowered once. Weakly
+# keyed so a reloaded or re-exported module's classes can still be freed.
+_LOWER_CLASS_NAMES: weakref.WeakKeyDictionary[type, str] = weakref.WeakKeyDictionary()
+
+
+def _lower_class_name(node: Any) -> str:
+    cls = type(node)
+    try:
+        return _LOWER_CLASS_NAMES[cls]
+    except KeyError:
+        name = _LOWER_CLASS_NAMES[cls] = cls.__name__.lower()
+        return name
+
+
 def _kind_for(node: Any) -> str:
     """Coarse classification of ``node``. Returns one of:
 
@@ -384,20 +423,16 @@ def _kind_for(node: Any) -> str:
     # below would otherwise grab it. Lazy import to avoid the circular
     # import — ``signals`` imports ``_registry`` which is part of the
     # same package and loads after ``routing`` alphabetically.
-    from .signals import Signal as _Signal
-
-    if isinstance(node, _Signal):
+    if isinstance(node, _signal_type()):
         return "Signal"
     # Arrays: lazy-import to avoid the circularity ``arrays`` → registry
     # → ``routing``. Tested before the duck-typed branches because an
     # ``ArrayView`` exposes neither ``bits``/``lsb`` nor a ``read`` that
     # returns a scalar, and we want ``soc.walk(kind="array")`` to see it
     # rather than the (empty) duck-type fallback.
-    from .arrays import ArrayView as _ArrayView
-
-    if isinstance(node, _ArrayView):
+    if isinstance(node, _array_view_type()):
         return "Array"
-    cls_name = type(node).__name__.lower()
+    cls_name = _lower_class_name(node)
     # Fields: bits/lsb take precedence over read/write because some
     # generated field types also expose a ``read()`` for typed readback.
     has_bits = hasattr(node, "bits") or hasattr(node, "lsb")
@@ -444,13 +479,8 @@ def _looks_like_child(value: Any) -> bool:
         return False
     # Path 3: ArrayView -- always a container. Lazy import to keep
     # ``arrays`` decoupled from ``routing`` at module import time.
-    try:
-        from .arrays import ArrayView as _ArrayView
-
-        if isinstance(value, _ArrayView):
-            return True
-    except ImportError:  # pragma: no cover - defensive
-        pass
+    if isinstance(value, _array_view_type()):
+        return True
     if callable(value) and not hasattr(value, "__dict__"):
         return False
     # Path 1: leaf-style node with a recognised hint attribute.
@@ -472,8 +502,34 @@ def _looks_like_child(value: Any) -> bool:
     return False
 
 
-def _iter_children(node: Any) -> Iterator[Any]:
-    """Yield duck-typed child nodes of ``node`` in deterministic order.
+# Public class-level attribute names per class, in ``dir()`` order, for the
+# descriptor pass of :func:`_iter_children`. ``dir()`` collects and sorts
+# every attribute on the class (methods included) each time it is called,
+# and a walk visits the same few generated classes over and over, so the
+# candidate list is built once per class. The runtime installs attributes
+# on generated classes after import (array properties, ``mem_view`` and
+# ``wait_poll`` helpers), so each entry also records the attribute names of
+# every ``__dict__`` in the MRO and is rebuilt when any of them changes.
+# Reading the names is far cheaper than ``dir()``'s merge and sort.
+_CLASS_CHILD_NAMES: weakref.WeakKeyDictionary[type, tuple[tuple[tuple[str, ...], ...], tuple[str, ...]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _class_child_names(cls: type) -> tuple[str, ...]:
+    keys = tuple(tuple(klass.__dict__) for klass in cls.__mro__)
+    cached = _CLASS_CHILD_NAMES.get(cls)
+    if cached is not None and cached[0] == keys:
+        return cached[1]
+    names = tuple(
+        name for name in dir(cls) if not name.startswith("_") and name not in ("parent", "master", "info")
+    )
+    _CLASS_CHILD_NAMES[cls] = (keys, names)
+    return names
+
+
+def _iter_children(node: Any) -> list[Any]:
+    """List duck-typed child nodes of ``node`` in deterministic order.
 
     Iterates ``vars(node)`` (the instance ``__dict__``) and filters out
     private members, the parent back-pointer, the bus master, and any
@@ -493,6 +549,7 @@ def _iter_children(node: Any) -> Iterator[Any]:
       actually sees the array attributes on a real C++ SoC.
     """
 
+    out: list[Any] = []
     seen: set[int] = set()
     try:
         items = vars(node)
@@ -511,7 +568,7 @@ def _iter_children(node: Any) -> Iterator[Any]:
                 continue
             if _looks_like_child(value):
                 seen.add(id(value))
-                yield value
+                out.append(value)
 
     # Phase 5 (#138): always also walk class-level descriptors. Real
     # pybind11 SoCs have an instance ``__dict__`` populated with bound
@@ -520,11 +577,7 @@ def _iter_children(node: Any) -> Iterator[Any]:
     # miss them. The de-dup guards against yielding an attribute that
     # surfaces both as a bound-method instance entry and a class-level
     # descriptor.
-    for name in dir(type(node)):
-        if name.startswith("_"):
-            continue
-        if name in ("parent", "master", "info"):
-            continue
+    for name in _class_child_names(type(node)):
         try:
             value = getattr(node, name)
         except Exception:
@@ -533,7 +586,8 @@ def _iter_children(node: Any) -> Iterator[Any]:
             continue
         if _looks_like_child(value):
             seen.add(id(value))
-            yield value
+            out.append(value)
+    return out
 
 
 def _walk(node: Any, *, kind: str | None = None) -> Iterator[Any]:
@@ -609,13 +663,9 @@ def _walk(node: Any, *, kind: str | None = None) -> Iterator[Any]:
         # a generated register/regfile that descends through the
         # standard ``_iter_children`` path.
         if _ArrayView is not None and isinstance(cur, _ArrayView):
-            entries = list(cur._iter_elements())
-            for child in reversed(entries):
-                stack.append(child)
+            stack.extend(reversed(list(cur._iter_elements())))
         else:
-            children = list(_iter_children(cur))
-            for child in reversed(children):
-                stack.append(child)
+            stack.extend(reversed(_iter_children(cur)))
 
 
 def _matches_kind(node: Any, kind: str | None) -> bool:
@@ -641,7 +691,7 @@ def _matches_kind(node: Any, kind: str | None) -> bool:
         return duck == "array"
     if duck and token in duck:
         return True
-    cls_name = type(node).__name__.lower()
+    cls_name = _lower_class_name(node)
     return token in cls_name
 
 
@@ -658,10 +708,15 @@ def _node_range(node: NodeLike) -> _Range | None:
     return _Range(int(addr), int(addr) + int(size))
 
 
+# Sort key for ``_coalesce``; ``attrgetter`` builds the tuple without a
+# Python frame per range.
+_RANGE_ORDER = operator.attrgetter("start", "end")
+
+
 def _coalesce(ranges: Iterable[_Range]) -> tuple[_Range, ...]:
     """Merge overlapping/adjacent ``_Range`` objects."""
 
-    sorted_ranges = sorted(ranges, key=lambda r: (r.start, r.end))
+    sorted_ranges = sorted(ranges, key=_RANGE_ORDER)
     merged: list[_Range] = []
     for r in sorted_ranges:
         if merged and r.start <= merged[-1].end:
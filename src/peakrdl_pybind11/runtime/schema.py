@@ -70,8 +70,11 @@ the conventions established by :mod:`runtime.widgets` and
 from __future__ import annotations
 
 import json
+import weakref
 from typing import Any
 
+from .routing import _array_view_type
+
 # ----------------------------------------------------------------------
 # Kind discrimination
 # ----------------------------------------------------------------------
@@ -109,24 +112,12 @@ def _node_kind(node: Any) -> str:
 
     # Phase 5: ArrayView wraps an RDL array node; render it as its
     # own ``kind="array"`` schema entry with a nested ``entry``.
-    try:
-        from .arrays import ArrayView as _ArrayView
-
-        if isinstance(node, _ArrayView):
-            return "array"
-    except ImportError:  # pragma: no cover - defensive
-        pass
+    if isinstance(node, _array_view_type()):
+        return "array"
 
-    cls = type(node).__name__.lower()
-    # Order matters: ``regfile`` must be tested before ``reg``.
-    for tag in ("regfile", "addrmap", "memory", "field"):
-        if tag in cls:
-            return "regfile" if tag == "regfile" else ("mem" if tag == "memory" else tag)
-    # ``mem`` substring alone, then ``reg`` last.
-    if "mem" in cls:
-        return "mem"
-    if "reg" in cls:
-        return "reg"
+    kind = _class_name_kind(type(node))
+    if kind is not None:
+        return kind
     # Phase 5 (#138): generated entry classes (``simple_array_soc__lut_t``)
     # carry neither ``reg`` nor ``regfile`` in their names. Fall back to
     # duck-typing -- a node with read/write is a register; a node with
@@ -141,6 +132,36 @@ def _node_kind(node: Any) -> str:
     return "node"
 
 
+# Result of the class-name step of :func:`_node_kind`, per class. A schema
+# walk meets the same few generated classes over and over, so the
+# lower-casing and substring tests run once per class rather than per node.
+# Weakly keyed so a reloaded or re-exported module's classes can be freed.
+_KIND_BY_CLASS: weakref.WeakKeyDictionary[type, str | None] = weakref.WeakKeyDictionary()
+
+
+def _class_name_kind(cls: type) -> str | None:
+    """Kind implied by ``cls.__name__`` alone, or ``None`` if it says nothing."""
+    try:
+        return _KIND_BY_CLASS[cls]
+    except KeyError:
+        pass
+    name = cls.__name__.lower()
+    kind: str | None = None
+    # Order matters: ``regfile`` must be tested before ``reg``.
+    for tag in ("regfile", "addrmap", "memory", "field"):
+        if tag in name:
+            kind = "regfile" if tag == "regfile" else ("mem" if tag == "memory" else tag)
+            break
+    else:
+        # ``mem`` substring alone, then ``reg`` last.
+        if "mem" in name:
+            kind = "mem"
+        elif "reg" in name:
+            kind = "reg"
+    _KIND_BY_CLASS[cls] = kind
+    return kind
+
+
 # ----------------------------------------------------------------------
 # Info accessor helpers — best-effort, fall back to direct attrs.
 # ----------------------------------------------------------------------
@@ -150,13 +171,21 @@ def _info(node: Any) -> Any:
     return getattr(node, "info", None)
 
 
-def _attr(node: Any, *names: str, default: Any = None) -> Any:
+# Default for the ``info`` keyword of the helpers below: the serializers
+# resolve ``node.info`` once per node and pass it in, rather than each of
+# the dozen-odd helper calls per field going through the ``.info``
+# property again.
+_UNRESOLVED: Any = object()
+
+
+def _attr(node: Any, *names: str, default: Any = None, info: Any = _UNRESOLVED) -> Any:
     """Return the first non-``None`` attribute resolved from info or node.
 
     Mirrors :func:`runtime.widgets._field_attr`: tries ``node.info.<name>``
     first, then falls back to the bare attribute on ``node``.
     """
-    info = _info(node)
+    if info is _UNRESOLVED:
+        info = _info(node)
     for name in names:
         if info is not None:
             value = getattr(info, name, None)
@@ -168,9 +197,10 @@ def _attr(node: Any, *names: str, default: Any = None) -> Any:
     return default
 
 
-def _description(node: Any) -> str | None:
+def _description(node: Any, info: Any = _UNRESOLVED) -> str | None:
     """Pull the human-readable description from info or the node itself."""
-    info = _info(node)
+    if info is _UNRESOLVED:
+        info = _info(node)
     if info is not None:
         # ``info.desc`` is canonical (see :mod:`runtime.info`); some
         # consumers spell it ``description`` so we honour both.
@@ -185,8 +215,9 @@ def _description(node: Any) -> str | None:
     return None
 
 
-def _path(node: Any, default: str = "") -> str:
-    info = _info(node)
+def _path(node: Any, default: str = "", info: Any = _UNRESOLVED) -> str:
+    if info is _UNRESOLVED:
+        info = _info(node)
     if info is not None:
         path = getattr(info, "path", None)
         if isinstance(path, str) and path:
@@ -198,8 +229,9 @@ def _path(node: Any, default: str = "") -> str:
     return default
 
 
-def _name(node: Any, default: str = "") -> str:
-    info = _info(node)
+def _name(node: Any, default: str = "", info: Any = _UNRESOLVED) -> str:
+    if info is _UNRESOLVED:
+        info = _info(node)
     if info is not None:
         value = getattr(info, "name", None)
         if isinstance(value, str) and value:
@@ -211,8 +243,9 @@ def _name(node: Any, default: str = "") -> str:
     return default
 
 
-def _address(node: Any) -> int | None:
-    info = _info(node)
+def _address(node: Any, info: Any = _UNRESOLVED) -> int | None:
+    if info is _UNRESOLVED:
+        info = _info(node)
     if info is not None:
         addr = getattr(info, "address", None)
         if isinstance(addr, int):
@@ -224,9 +257,9 @@ def _address(node: Any) -> int | None:
     return None
 
 
-def _width_for_reg(node: Any) -> int | None:
+def _width_for_reg(node: Any, info: Any = _UNRESOLVED) -> int | None:
     """Register / memory word width in bits."""
-    return _attr(node, "regwidth", "width", default=None)
+    return _attr(node, "regwidth", "width", default=None, info=info)
 
 
 def _access_str(value: Any) -> str | None:
@@ -357,7 +390,7 @@ def _field_dict(field: Any) -> dict[str, Any]:
     """
     info = _info(field)
 
-    lsb = _attr(field, "lsb", default=None)
+    lsb = _attr(field, "lsb", default=None, info=info)
     if lsb is None and info is not None:
         # Per ``info._info_factory``, fields carry their lsb in ``offset``.
         offset = getattr(info, "offset", None)
@@ -366,32 +399,32 @@ def _field_dict(field: Any) -> dict[str, Any]:
     if lsb is None:
         lsb = 0
 
-    width = _attr(field, "width", "regwidth", default=1)
+    width = _attr(field, "width", "regwidth", default=1, info=info)
 
-    access_value = _attr(field, "access", default=None)
+    access_value = _attr(field, "access", default=None, info=info)
     access = _access_str(access_value)
 
     # Some test fakes expose ``is_readable`` / ``is_writable`` directly.
-    is_readable = _attr(field, "is_readable")
+    is_readable = _attr(field, "is_readable", info=info)
     if is_readable is None:
         is_readable = _is_readable_from_access(access)
-    is_writable = _attr(field, "is_writable")
+    is_writable = _attr(field, "is_writable", info=info)
     if is_writable is None:
         is_writable = _is_writable_from_access(access)
 
     out: dict[str, Any] = {
         "kind": "field",
-        "name": _name(field),
-        "path": _path(field),
+        "name": _name(field, info=info),
+        "path": _path(field, info=info),
         "lsb": int(lsb),
         "width": int(width),
         "is_readable": bool(is_readable),
         "is_writable": bool(is_writable),
-        "is_hw_readable": bool(_attr(field, "is_hw_readable", default=False)),
-        "is_hw_writable": bool(_attr(field, "is_hw_writable", default=False)),
+        "is_hw_readable": bool(_attr(field, "is_hw_readable", default=False, info=info)),
+        "is_hw_writable": bool(_attr(field, "is_hw_writable", default=False, info=info)),
         "access": access,
-        "reset": _attr(field, "reset", default=None),
-        "description": _description(field),
+        "reset": _attr(field, "reset", default=None, info=info),
+        "description": _description(field, info=info),
     }
 
     encode = _encode_metadata(field)
@@ -511,15 +544,16 @@ def _iter_children(node: Any) -> list[Any]:
 
 def _container_dict(node: Any, kind: str) -> dict[str, Any]:
     """Render a container node (soc / addrmap / regfile)."""
+    info = _info(node)
     out: dict[str, Any] = {
         "kind": kind,
-        "name": _name(node),
-        "path": _path(node),
+        "name": _name(node, info=info),
+        "path": _path(node, info=info),
     }
-    address = _address(node)
+    address = _address(node, info=info)
     if address is not None:
         out["address"] = int(address)
-    description = _description(node)
+    description = _description(node, info=info)
     if description is not None:
         out["description"] = description
     out["children"] = [_node_dict(child) for child in _iter_children(node)]
@@ -527,18 +561,19 @@ def _container_dict(node: Any, kind: str) -> dict[str, Any]:
 
 
 def _reg_dict(node: Any) -> dict[str, Any]:
+    info = _info(node)
     out: dict[str, Any] = {
         "kind": "reg",
-        "name": _name(node),
-        "path": _path(node),
+        "name": _name(node, info=info),
+        "path": _path(node, info=info),
     }
-    address = _address(node)
+    address = _address(node, info=info)
     if address is not None:
         out["address"] = int(address)
-    width = _width_for_reg(node)
+    width = _width_for_reg(node, info=info)
     if width is not None:
         out["width"] = int(width)
-    description = _description(node)
+    description = _description(node, info=info)
     if description is not None:
         out["description"] = description
     out["fields"] = [_field_dict(f) for f in _iter_fields(node)]
@@ -546,18 +581,19 @@ def _reg_dict(node: Any) -> dict[str, Any]:
 
 
 def _mem_dict(node: Any) -> dict[str, Any]:
+    info = _info(node)
     out: dict[str, Any] = {
         "kind": "mem",
-        "name": _name(node),
-        "path": _path(node),
+        "name": _name(node, info=info),
+        "path": _path(node, info=info),
     }
-    address = _address(node)
+    address = _address(node, info=info)
     if address is not None:
         out["address"] = int(address)
-    width = _width_for_reg(node)
+    width = _width_for_reg(node, info=info)
     if width is not None:
         out["width"] = int(width)
-    description = _description(node)
+    description = _description(node, info=info)
     if description is not None:
         out["description"] = description
     return out
@@ -46,7 +46,7 @@ logger = logging.getLogger("peakrdl_pybind11.runtime.signals")
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signal:
     """RDL ``signal`` metadata, attached to its parent node on the SoC tree.
 
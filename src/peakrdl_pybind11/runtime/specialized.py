@@ -486,9 +486,8 @@ def _walk_registers(node: Any) -> Iterable[Any]:
             yield current
             continue
 
-        children = _children_of(current)
         # Reverse so the natural iteration order is preserved when popping.
-        stack.extend(reversed(list(children)))
+        stack.extend(reversed(_children_of(current)))
 
 
 def _looks_like_register(node: Any) -> bool:
@@ -505,57 +504,58 @@ def _looks_like_register(node: Any) -> bool:
     return True
 
 
-def _children_of(node: Any) -> Iterable[Any]:
-    """Best-effort iteration of ``node``'s descendants.
+def _children_of(node: Any) -> list[Any]:
+    """Best-effort listing of ``node``'s descendants.
 
-    Looks for, in order:
+    Looks for, in order, and uses the first source that yields a result:
 
     1. ``node._children()`` (callable returning an iterable).
     2. ``node.children`` (attribute that is iterable).
     3. ``node._registers``, ``node._regfiles`` (lists set by generated code).
     4. Any attribute on the instance whose value also looks register-shaped.
+
+    Each source is materialised inside its own ``try`` so a ``TypeError``
+    raised part-way through one source never leaves half of its children
+    behind for the next source to re-list.
     """
     children_fn = getattr(node, "_children", None)
     if callable(children_fn):
         try:
-            yield from cast(Iterable[Any], children_fn())
-            return
+            return list(cast(Iterable[Any], children_fn()))
         except TypeError:
             pass
 
     children_attr = getattr(node, "children", None)
     if children_attr is not None and not isinstance(children_attr, type):
         try:
-            yield from list(children_attr)
-            return
+            return list(children_attr)
         except TypeError:
             pass
 
-    yielded_any = False
+    collected: list[Any] = []
     for attr in ("_registers", "_regfiles", "_addrmaps"):
         coll = getattr(node, attr, None)
         if coll is None:
             continue
         try:
-            for child in coll:
-                yielded_any = True
-                yield child
+            collected.extend(list(coll))
         except TypeError:
             continue
-    if yielded_any:
-        return
+    if collected:
+        return collected
 
     # Final fallback: scan ``__dict__`` for register-shaped attributes. Used
     # by hand-rolled stubs and by generated top-level SoC objects whose
     # children are bound directly as public attributes.
     instance_dict = getattr(node, "__dict__", None) or {}
-    for name, value in instance_dict.items():
-        if name.startswith("_"):
-            continue
-        if value is node or value is None:
-            continue
-        if _looks_like_register(value) or _looks_like_container(value):
-            yield value
+    return [
+        value
+        for name, value in instance_dict.items()
+        if not name.startswith("_")
+        and value is not node
+        and value is not None
+        and (_looks_like_register(value) or _looks_like_container(value))
+    ]
 
 
 def _looks_like_container(node: Any) -> bool:
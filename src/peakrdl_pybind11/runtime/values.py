@@ -506,9 +506,9 @@ class RegisterValue(int):
         """
         new_value = int(self)
         for fname, fval in fields.items():
-            if fname not in self._fields_meta:
+            meta = self._fields_meta.get(fname)
+            if meta is None:
                 raise KeyError(self._missing_field_message(fname))
-            meta = self._fields_meta[fname]
             lsb = meta["lsb"]
             width = meta["width"]
             ival = _coerce_field_value(fval, name=fname, width=width)
@@ -518,7 +518,9 @@ class RegisterValue(int):
             new_value,
             address=self._address,
             width=self._width,
-            fields=self._fields_meta,
+            # Already normalized by this value's own constructor; share it
+            # rather than re-validating and rebuilding every field's dict.
+            fields_normalized=self._fields_meta,
             register_class=self._register_class,
             name=self._name,
             path=self._path,
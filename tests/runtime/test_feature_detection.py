@@ -383,3 +383,13 @@ def test_plugin_discovery_includes_feature_detection() -> None:
     assert any(type(p).__name__ == "FeatureDetectionPlugin" for p in plugins), [
         type(p).__name__ for p in plugins
     ]
+
+
+def test_plugin_registered_once_across_exporters() -> None:
+    from peakrdl_pybind11.exporter_plugins import registered_plugins
+
+    Pybind11Exporter()
+    Pybind11Exporter()
+
+    plugins = [p for p in registered_plugins() if type(p).__name__ == "FeatureDetectionPlugin"]
+    assert len(plugins) == 1
@@ -629,6 +629,43 @@ def test_walk_kind_field_filters_to_fields_only() -> None:
     assert names == ["tx_ready", "rx_ready", "enable"]
 
 
+def test_walk_sees_class_attributes_installed_after_first_walk() -> None:
+    """A class-level child added after a walk still shows up in the next one."""
+
+    from peakrdl_pybind11.runtime.routing import attach_discovery
+
+    class _LateSoC(_DiscSoC):
+        pass
+
+    soc = _LateSoC()
+    attach_discovery(soc)
+    assert [n.name for n in soc.walk(kind="reg")] == ["intr_state", "ctrl"]
+
+    extra = _DiscReg("extra", offset=0x20, fields={})
+    _LateSoC.extra = property(lambda self: extra)  # type: ignore[attr-defined]
+    assert [n.name for n in soc.walk(kind="reg")] == ["intr_state", "ctrl", "extra"]
+
+
+def test_walk_sees_class_attribute_replaced_after_first_walk() -> None:
+    """Swapping one class-level child for another (same count) is picked up."""
+
+    from peakrdl_pybind11.runtime.routing import attach_discovery
+
+    old = _DiscReg("old", offset=0x20, fields={})
+    new = _DiscReg("new", offset=0x24, fields={})
+
+    class _SwapSoC(_DiscSoC):
+        old_reg = property(lambda self: old)
+
+    soc = _SwapSoC()
+    attach_discovery(soc)
+    assert [n.name for n in soc.walk(kind="reg")] == ["intr_state", "ctrl", "old"]
+
+    del _SwapSoC.old_reg
+    _SwapSoC.new_reg = property(lambda self: new)  # type: ignore[attr-defined]
+    assert [n.name for n in soc.walk(kind="reg")] == ["intr_state", "ctrl", "new"]
+
+
 def test_find_by_addr_returns_matching_register() -> None:
     """``soc.find(addr)`` returns the register whose ``.offset == addr``."""
 
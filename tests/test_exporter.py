@@ -6,6 +6,7 @@ import ast
 import os
 import re
 import tempfile
+from pathlib import Path
 
 import pytest
 from systemrdl import RDLCompiler
@@ -176,7 +177,23 @@ class TestExporter:
                 content = f.read()
             
             assert 'version = "0.1.0"' in content
-    
+
+    def test_pyproject_requires_ninja(self):
+        """Generated pyproject.toml never falls back to a serial Make build"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(SIMPLE_RDL))
+        root = rdl.elaborate()
+
+        for backend in ("pybind11", "nanobind"):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                exporter = Pybind11Exporter()
+                exporter.export(root.top, tmpdir, soc_name="test_soc", backend=backend)
+
+                with open(os.path.join(tmpdir, 'pyproject.toml')) as f:
+                    content = f.read()
+
+                assert 'ninja.make-fallback = false' in content
+
     def test_no_pyi_generation(self):
         """Test export without .pyi stub generation"""
         rdl = RDLCompiler()
@@ -380,6 +397,9 @@ class TestExporter:
             # Verify chunk has register bindings
             assert 'void bind_registers_chunk_0' in chunk_content
             assert '#include <pybind11/pybind11.h>' in chunk_content
+            # Chunks don't convert STL types, so they skip the STL casters
+            assert '#include <pybind11/stl.h>' not in chunk_content
+            assert '#include <pybind11/stl.h>' in main_content
             
             # Verify CMakeLists.txt includes all source files
             with open(os.path.join(tmpdir, 'CMakeLists.txt')) as f:
@@ -389,6 +409,71 @@ class TestExporter:
             assert 'large_soc_bindings_0.cpp' in cmake_content
             assert 'large_soc_bindings_1.cpp' in cmake_content
     
+    def test_split_bindings_jobs_match_serial(self):
+        """Test that rendering outputs and split chunks on worker threads gives the serial output"""
+        rdl_content = "addrmap large_soc {\n"
+        for i in range(10):
+            rdl_content += f"""
+    reg {{
+        field {{
+            sw = rw;
+            hw = r;
+        }} field{i}[7:0];
+    }} reg{i} @ 0x{i*4:04x};
+"""
+        rdl_content += "};\n"
+
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(rdl_content))
+        root = rdl.elaborate()
+
+        outputs = []
+        for jobs in (1, 4):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                exporter = Pybind11Exporter()
+                exporter.export(root.top, tmpdir, soc_name="large_soc", split_bindings=3, jobs=jobs)
+
+                files = {}
+                for path in sorted(Path(tmpdir).rglob('*')):
+                    if path.is_file():
+                        files[str(path.relative_to(tmpdir))] = path.read_text()
+                outputs.append(files)
+
+        assert outputs[0] == outputs[1]
+        assert 'void bind_registers_chunk_3' in outputs[1]['large_soc_bindings_3.cpp']
+        assert 'large_soc/__init__.pyi' in outputs[1]
+
+    def test_split_bindings_single_tu(self):
+        """Test that single_tu builds the split binding files through one translation unit"""
+        rdl_content = "addrmap large_soc {\n"
+        for i in range(10):
+            rdl_content += f"""
+    reg {{
+        field {{
+            sw = rw;
+            hw = r;
+        }} field{i}[7:0];
+    }} reg{i} @ 0x{i*4:04x};
+"""
+        rdl_content += "};\n"
+
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(rdl_content))
+        root = rdl.elaborate()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = Pybind11Exporter()
+            exporter.export(root.top, tmpdir, soc_name="large_soc", split_bindings=5, single_tu=True)
+
+            all_content = Path(tmpdir, 'large_soc_bindings_all.cpp').read_text()
+            assert '#include "large_soc_bindings.cpp"' in all_content
+            assert '#include "large_soc_bindings_0.cpp"' in all_content
+            assert '#include "large_soc_bindings_1.cpp"' in all_content
+
+            cmake_content = Path(tmpdir, 'CMakeLists.txt').read_text()
+            assert 'large_soc_bindings_all.cpp' in cmake_content
+            assert 'large_soc_bindings_0.cpp' not in cmake_content
+
     def test_hierarchical_split_bindings(self):
         """Test that bindings are split by hierarchy (addrmap/regfile)"""
         # Create RDL with hierarchical structure
@@ -452,7 +537,280 @@ addrmap hierarchical_soc {
             assert 'hierarchical_soc_bindings.cpp' in cmake_content
             assert 'hierarchical_soc_bindings_0.cpp' in cmake_content
             assert 'hierarchical_soc_bindings_1.cpp' in cmake_content
-    
+
+    def test_split_descriptor_headers(self):
+        """Test that split bindings get one register header per top-level group"""
+        rdl_content = """
+addrmap grouped_soc {
+    regfile {
+        reg { field { sw = rw; hw = r; } data[7:0]; } reg0 @ 0x00;
+        reg { field { sw = rw; hw = r; } data[7:0]; } reg1 @ 0x04;
+    } uart @ 0x0000;
+
+    regfile {
+        reg { field { sw = rw; hw = r; } data[7:0]; } reg2 @ 0x00;
+        reg { field { sw = rw; hw = r; } data[7:0]; } reg3 @ 0x04;
+    } spi @ 0x1000;
+
+    reg { field { sw = rw; hw = r; } data[7:0]; } ctrl @ 0x2000;
+};
+"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(rdl_content))
+        root = rdl.elaborate()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = Pybind11Exporter()
+            exporter.export(root.top, tmpdir, soc_name="grouped_soc", split_bindings=2)
+
+            groups = ['grouped_soc_uart_descriptors.hpp', 'grouped_soc_spi_descriptors.hpp',
+                      'grouped_soc_top_descriptors.hpp']
+            for header in groups + ['grouped_soc_descriptors_common.hpp']:
+                assert os.path.exists(os.path.join(tmpdir, header))
+
+            # The umbrella header pulls every group back in
+            with open(os.path.join(tmpdir, 'grouped_soc_descriptors.hpp')) as f:
+                umbrella = f.read()
+            for header in groups:
+                assert f'#include "{header}"' in umbrella
+            assert 'class RegisterBase {' not in umbrella
+
+            with open(os.path.join(tmpdir, 'grouped_soc_uart_descriptors.hpp')) as f:
+                uart = f.read()
+            assert 'class grouped_soc__uart__reg0_t' in uart
+            assert 'class grouped_soc__spi__reg2_t' not in uart
+
+            # Each chunk includes only the groups of the registers it binds
+            with open(os.path.join(tmpdir, 'grouped_soc_bindings_0.cpp')) as f:
+                chunk0 = f.read()
+            assert '#include "grouped_soc_uart_descriptors.hpp"' in chunk0
+            assert 'grouped_soc_spi_descriptors.hpp' not in chunk0
+            assert '#include "grouped_soc_descriptors.hpp"' not in chunk0
+
+            with open(os.path.join(tmpdir, 'CMakeLists.txt')) as f:
+                cmake_content = f.read()
+            assert 'PRIVATE "grouped_soc_descriptors_common.hpp"' in cmake_content
+
+        # Unsplit exports keep a single self-contained header
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = Pybind11Exporter()
+            exporter.export(root.top, tmpdir, soc_name="grouped_soc", split_bindings=0)
+
+            assert not os.path.exists(os.path.join(tmpdir, 'grouped_soc_descriptors_common.hpp'))
+            with open(os.path.join(tmpdir, 'grouped_soc_descriptors.hpp')) as f:
+                assert 'class grouped_soc__uart__reg0_t' in f.read()
+
+    def test_reexport_keeps_unchanged_files(self):
+        """Test that re-exporting only rewrites files whose content changed"""
+        def compile_soc(field_name):
+            rdl_content = "addrmap large_soc {\n"
+            for i in range(4):
+                name = field_name if i == 3 else f"field{i}"
+                rdl_content += f"    reg {{ field {{ sw = rw; hw = r; }} {name}[7:0]; }} reg{i} @ 0x{i*4:04x};\n"
+            rdl_content += "};\n"
+            rdl = RDLCompiler()
+            rdl.compile_file(self._write_rdl(rdl_content))
+            return rdl.elaborate()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Pybind11Exporter().export(compile_soc("field3").top, tmpdir, soc_name="large_soc", split_bindings=2)
+
+            # Backdate everything so a rewrite is visible regardless of timer resolution
+            old_mtime_ns = 1_000_000_000 * 10**9
+            for name in os.listdir(tmpdir):
+                path = os.path.join(tmpdir, name)
+                if os.path.isfile(path):
+                    os.utime(path, ns=(old_mtime_ns, old_mtime_ns))
+
+            # Rename a field in the second chunk's register only
+            Pybind11Exporter().export(compile_soc("renamed").top, tmpdir, soc_name="large_soc", split_bindings=2)
+
+            def mtime(name):
+                return os.stat(os.path.join(tmpdir, name)).st_mtime_ns
+
+            assert mtime('large_soc_bindings_0.cpp') == old_mtime_ns
+            assert mtime('CMakeLists.txt') == old_mtime_ns
+            assert mtime('large_soc_bindings_1.cpp') != old_mtime_ns
+            with open(os.path.join(tmpdir, 'large_soc_bindings_1.cpp')) as f:
+                assert 'renamed' in f.read()
+            assert not [name for name in os.listdir(tmpdir) if name.endswith('.tmp')]
+
+    def test_template_bytecode_cache(self):
+        """Test that templates loaded from the bytecode cache render the same output"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(SIMPLE_RDL))
+        root = rdl.elaborate()
+
+        outputs = []
+        for use_cache in (False, True, True):
+            exporter = Pybind11Exporter()
+            if use_cache:
+                assert exporter.env.bytecode_cache is not None
+            else:
+                exporter.env.bytecode_cache = None
+            with tempfile.TemporaryDirectory() as tmpdir:
+                exporter.export(root.top, tmpdir, soc_name="simple_soc")
+                files = {}
+                for name in ('simple_soc_descriptors.hpp', 'simple_soc_bindings.cpp', '__init__.py'):
+                    with open(os.path.join(tmpdir, name)) as f:
+                        files[name] = f.read()
+                outputs.append(files)
+
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_exporters_share_compiled_templates(self):
+        """Test that a new exporter reuses templates compiled by an earlier one"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(SIMPLE_RDL))
+        root = rdl.elaborate()
+
+        first, second = Pybind11Exporter(), Pybind11Exporter()
+        assert first.env.bytecode_cache is second.env.bytecode_cache
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first.export(root.top, tmpdir, soc_name="simple_soc")
+
+        template = second.env.get_template("descriptors.hpp.jinja")
+        assert template.root_render_func.__code__ is (
+            first.env.get_template("descriptors.hpp.jinja").root_render_func.__code__
+        )
+
+    def test_reg_fields_filter_reuses_collected_fields(self):
+        """Test that templates iterate the FieldNodes collected for each register"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(SIMPLE_RDL))
+        root = rdl.elaborate()
+
+        exporter = Pybind11Exporter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter.export(root.top, tmpdir, soc_name="simple_soc")
+
+        reg_fields = exporter.env.filters["reg_fields"]
+        reg = next(root.top.descendants(unroll=False))
+        collected = exporter._fields_by_id.values()
+        assert all(fields is reg_fields(fields[0].parent) for fields in collected)
+        # Wrappers not seen by _collect_nodes still get their fields.
+        assert [f.inst_name for f in reg_fields(reg)] == [f.inst_name for f in reg.fields()]
+
+    def test_rdl_property_filter_memoizes_lookups(self):
+        """Test that templates resolve each node property once per export"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(SIMPLE_RDL))
+        root = rdl.elaborate()
+
+        exporter = Pybind11Exporter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter.export(root.top, tmpdir, soc_name="simple_soc")
+
+        rdl_property = exporter.env.filters["rdl_property"]
+        reg = next(iter(exporter._fields_by_id.values()))[0].parent
+        assert (id(reg), "desc") in exporter._properties_by_key
+        assert rdl_property(reg, "desc") == reg.get_property("desc")
+        assert rdl_property(reg, "regwidth") == reg.get_property("regwidth")
+
+    def test_exporter_reuse_renames_nodes(self):
+        """Test that a reused exporter names each design's nodes afresh"""
+        exporter = Pybind11Exporter()
+        for reg_name in ("first", "second"):
+            rdl = RDLCompiler()
+            rdl.compile_file(self._write_rdl(
+                f"addrmap reuse_soc {{ reg {{ field {{ sw = rw; }} f[7:0]; }} {reg_name} @ 0x0; }};"
+            ))
+            with tempfile.TemporaryDirectory() as tmpdir:
+                exporter.export(rdl.elaborate().top, tmpdir, soc_name="reuse_soc")
+                with open(os.path.join(tmpdir, 'reuse_soc_descriptors.hpp')) as f:
+                    content = f.read()
+            assert f'class reuse_soc__{reg_name}_t' in content
+        assert 'reuse_soc__first' not in content
+
+    def test_cmake_size_flags(self):
+        """Test that both backends drop unused sections and offer opt-in LTO"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(SIMPLE_RDL))
+        root = rdl.elaborate()
+
+        for backend in ("pybind11", "nanobind"):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                Pybind11Exporter().export(root.top, tmpdir, soc_name="test_soc", backend=backend)
+                with open(os.path.join(tmpdir, 'CMakeLists.txt')) as f:
+                    cmake_content = f.read()
+            assert '-ffunction-sections' in cmake_content
+            assert '-Wl,--gc-sections' in cmake_content
+            assert 'option(PEAKRDL_PYBIND_LTO' in cmake_content
+            assert 'INTERPROCEDURAL_OPTIMIZATION TRUE' in cmake_content
+
+    def test_nanobind_backend(self):
+        """Test that backend="nanobind" emits nanobind bindings and build files"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(SIMPLE_RDL))
+        root = rdl.elaborate()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = Pybind11Exporter()
+            exporter.export(root.top, tmpdir, soc_name="test_soc", backend="nanobind")
+
+            with open(os.path.join(tmpdir, 'test_soc_bindings.cpp')) as f:
+                content = f.read()
+
+            assert '#include <nanobind/nanobind.h>' in content
+            assert 'NB_MODULE(_test_soc_native, m)' in content
+            assert '#include <pybind11' not in content
+            assert 'py::' not in content
+
+            with open(os.path.join(tmpdir, 'CMakeLists.txt')) as f:
+                cmake_content = f.read()
+            assert 'nanobind_add_module(_test_soc_native' in cmake_content
+            assert 'cxx_std_17' in cmake_content
+
+            with open(os.path.join(tmpdir, 'pyproject.toml')) as f:
+                pyproject_content = f.read()
+            assert 'nanobind' in pyproject_content
+            assert 'pybind11' not in pyproject_content
+
+            # The descriptor header is shared between backends
+            assert os.path.exists(os.path.join(tmpdir, 'test_soc_descriptors.hpp'))
+
+    def test_nanobind_backend_split(self):
+        """Test that split nanobind bindings declare chunks against nb::module_"""
+        rdl_content = "addrmap large_soc {\n"
+        for i in range(10):
+            rdl_content += f"""
+    reg {{
+        field {{
+            sw = rw;
+            hw = r;
+        }} field{i}[7:0];
+    }} reg{i} @ 0x{i*4:04x};
+"""
+        rdl_content += "};\n"
+
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(rdl_content))
+        root = rdl.elaborate()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = Pybind11Exporter()
+            exporter.export(root.top, tmpdir, soc_name="large_soc", split_bindings=5, backend="nanobind")
+
+            with open(os.path.join(tmpdir, 'large_soc_bindings.cpp')) as f:
+                main_content = f.read()
+            assert 'void bind_registers_chunk_1(nb::module_& m);' in main_content
+
+            with open(os.path.join(tmpdir, 'large_soc_bindings_1.cpp')) as f:
+                chunk_content = f.read()
+            assert 'void bind_registers_chunk_1(nb::module_& m)' in chunk_content
+            assert 'py::' not in chunk_content
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected"""
+        rdl = RDLCompiler()
+        rdl.compile_file(self._write_rdl(SIMPLE_RDL))
+        root = rdl.elaborate()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = Pybind11Exporter()
+            with pytest.raises(ValueError, match="Unknown backend"):
+                exporter.export(root.top, tmpdir, backend="boost_python")
+
     def test_no_split_bindings(self):
         """Test that bindings are not split when below threshold"""
         rdl = RDLCompiler()
@@ -569,7 +927,9 @@ addrmap hierarchical_soc {
         env.filters["safe_id"] = exporter._sanitize_identifier
         env.filters["named_type"] = exporter._named_type_for_node
         env.filters["members"] = exporter._members_for_node
+        env.filters["reg_fields"] = exporter._fields_for_node
         env.filters["field_encode_members"] = exporter._field_encode_members_for_node
+        env.filters["rdl_property"] = exporter._node_property
         template = env.get_template("stubs.pyi.jinja")
         rendered = template.render(
             soc_name="simple_soc",
@@ -623,7 +983,9 @@ addrmap hierarchical_soc {
         env.filters["safe_id"] = exporter._sanitize_identifier
         env.filters["named_type"] = exporter._named_type_for_node
         env.filters["members"] = exporter._members_for_node
+        env.filters["reg_fields"] = exporter._fields_for_node
         env.filters["field_encode_members"] = exporter._field_encode_members_for_node
+        env.filters["rdl_property"] = exporter._node_property
         template = env.get_template("stubs.pyi.jinja")
         rendered = template.render(
             soc_name="unpack_soc",
@@ -670,7 +1032,9 @@ addrmap hierarchical_soc {
         env.filters["safe_id"] = exporter._sanitize_identifier
         env.filters["named_type"] = exporter._named_type_for_node
         env.filters["members"] = exporter._members_for_node
+        env.filters["reg_fields"] = exporter._fields_for_node
         env.filters["field_encode_members"] = exporter._field_encode_members_for_node
+        env.filters["rdl_property"] = exporter._node_property
         template = env.get_template("stubs.pyi.jinja")
         rendered = template.render(
             soc_name="matrix_soc",
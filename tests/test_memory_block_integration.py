@@ -150,3 +150,17 @@ class TestMemoryBlock:
         # Length mismatch / out of range on write.
         with pytest.raises((IndexError, ValueError, RuntimeError, OverflowError)):
             soc.data_mem.write_block(n - 1, [0, 1, 2])
+
+    def test_slice_returns_live_entries(self, tmpdir):
+        soc_module = _build_test_module(tmpdir)
+        if soc_module is None:
+            pytest.skip("Could not build test module (cmake/pybind11 unavailable)")
+
+        soc = soc_module.create()
+        soc.attach_master(soc_module.MockMaster())
+        soc.data_mem.write_block(0, list(range(64)))
+
+        entries = soc.data_mem[2:10:3]
+        assert len(entries) == 3
+        assert [int(entry.read()) for entry in entries] == [2, 5, 8]
+        assert entries[1].offset == soc.data_mem[5].offset
@@ -0,0 +1,176 @@
+"""Integration test for the nanobind backend.
+
+Exports a small SoC with ``backend="nanobind"`` and split bindings,
+builds it with cmake against the installed nanobind, imports it, and
+drives it through the native masters, a Python master (the trampoline
+path) and the array bindings. The string-level checks in
+``test_exporter.py`` only prove the templates render; this proves the
+generated C++ compiles and behaves like the pybind11 module.
+
+Skips automatically if cmake or nanobind isn't available.
+"""
+
+import importlib.util
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from systemrdl import RDLCompiler
+
+from peakrdl_pybind11 import Pybind11Exporter
+
+pytestmark = pytest.mark.integration
+
+NANOBIND_RDL = """
+addrmap nb_soc {
+    name = "nanobind backend integration test";
+
+    reg ctrl_t {
+        field { sw = rw; hw = r; } enable[0:0] = 0;
+        field { sw = rw; hw = r; } mode[3:1] = 0;
+    };
+
+    regfile uart_t {
+        ctrl_t ctrl @ 0x0;
+        reg {
+            field { sw = rw; hw = r; } lo[7:0] = 0;
+            field { sw = rw; hw = r; } hi[15:8] = 0;
+        } data @ 0x4;
+    };
+
+    uart_t uart @ 0x000;
+    reg {
+        field { sw = rw; hw = r; } value[31:0] = 0;
+    } lut[4] @ 0x100 += 0x4;
+    uart_t chan[2] @ 0x200 += 0x10;
+};
+"""
+
+
+def _build_nanobind_module(workdir, soc_name="nb_soc"):
+    """Export + build + import the SoC with the nanobind backend, or return None."""
+    if shutil.which("cmake") is None or importlib.util.find_spec("nanobind") is None:
+        return None
+    import nanobind
+
+    rdl_path = Path(workdir) / "nb.rdl"
+    rdl_path.write_text(NANOBIND_RDL)
+
+    rdl = RDLCompiler()
+    Pybind11Exporter.register_udps(rdl)
+    rdl.compile_file(str(rdl_path))
+    root = rdl.elaborate()
+
+    output_dir = Path(workdir) / "out"
+    output_dir.mkdir()
+    # Split bindings so the chunk and main-module templates are compiled too.
+    Pybind11Exporter().export(
+        root.top, str(output_dir), soc_name=soc_name, split_bindings=2, backend="nanobind"
+    )
+
+    build_dir = output_dir / "build"
+    configure = [
+        "cmake",
+        "-S", str(output_dir),
+        "-B", str(build_dir),
+        f"-Dnanobind_DIR={nanobind.cmake_dir()}",
+        f"-DPython_EXECUTABLE={sys.executable}",
+    ]
+    if subprocess.run(configure, capture_output=True, text=True).returncode != 0:
+        return None
+    if subprocess.run(["cmake", "--build", str(build_dir), "--config", "Release"],
+                      capture_output=True, text=True).returncode != 0:
+        return None
+
+    so_files = list(build_dir.glob("**/*.so")) + list(build_dir.glob("**/*.pyd"))
+    if not so_files:
+        return None
+    pkg_dir = output_dir / soc_name
+    shutil.copy(so_files[0], pkg_dir)
+
+    sys.path.insert(0, str(output_dir))
+    spec = importlib.util.spec_from_file_location(soc_name, str(pkg_dir / "__init__.py"))
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[soc_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        print(f"Failed to import generated module: {e}")
+        return None
+    return module
+
+
+@pytest.fixture(scope="module")
+def nb_module(tmp_path_factory):
+    module = _build_nanobind_module(tmp_path_factory.mktemp("nanobind_integration"))
+    if module is None:
+        pytest.skip("Could not build nanobind test module (cmake/nanobind unavailable)")
+    return module
+
+
+class TestNanobindBackend:
+    def test_native_mock_master_round_trip(self, nb_module):
+        soc = nb_module.create()
+        master = nb_module.MockMaster()
+        soc.attach_master(master)
+
+        soc.uart.data.write(0xBEEF)
+        assert int(soc.uart.data.read()) == 0xBEEF
+        soc.uart.ctrl.mode.write(5)
+        assert int(soc.uart.ctrl.mode.read()) == 5
+        assert int(soc.uart.ctrl.read()) == 0b1010
+        assert master.size == 2
+
+    def test_write_fields_and_context_manager(self, nb_module):
+        soc = nb_module.create()
+        soc.attach_master(nb_module.MockMaster())
+
+        soc.uart.data.write_fields(lo=0x12, hi=0x34)
+        assert int(soc.uart.data.read()) == 0x3412
+        with soc.uart.data as reg:
+            reg.lo.write(0x56)
+        assert int(soc.uart.data.read()) == 0x3456
+
+    def test_callback_master_round_trip(self, nb_module):
+        soc = nb_module.create()
+        store = {}
+        soc.attach_master(
+            nb_module.CallbackMaster(
+                lambda addr, width: store.get(addr, 0),
+                lambda addr, value, width: store.__setitem__(addr, value),
+            )
+        )
+
+        soc.uart.data.write(0xAA)
+        assert int(soc.uart.data.read()) == 0xAA
+        assert store == {soc.uart.data.offset: 0xAA}
+
+    def test_python_master_through_trampoline(self, nb_module):
+        from peakrdl_pybind11.masters import MockMaster
+
+        soc = nb_module.create()
+        mock = MockMaster()
+        soc.attach_master(nb_module.wrap_master(mock))
+
+        soc.uart.ctrl.enable.write(1)
+        assert int(soc.uart.ctrl.read()) == 1
+        assert mock.read(soc.uart.ctrl.offset, 4) == 1
+
+    def test_register_and_regfile_arrays(self, nb_module):
+        soc = nb_module.create()
+        soc.attach_master(nb_module.MockMaster())
+
+        assert len(soc.lut) == 4
+        assert soc.lut[2].offset == 0x108
+        soc.lut[2].write(0x1234)
+        assert [int(reg.read()) for reg in soc.lut] == [0, 0, 0x1234, 0]
+        assert [reg.offset for reg in soc.lut[1:3]] == [0x104, 0x108]
+
+        soc.chan[1].ctrl.enable.write(1)
+        assert soc.chan[1].ctrl.offset == 0x210
+        assert int(soc.chan[1].ctrl.read()) == 1
+        assert int(soc.chan[0].ctrl.read()) == 0
@@ -174,7 +174,9 @@ class TestStubUDPNamespace:
             env.filters["safe_id"] = exporter._sanitize_identifier
             env.filters["named_type"] = exporter._named_type_for_node
             env.filters["members"] = exporter._members_for_node
+            env.filters["reg_fields"] = exporter._fields_for_node
             env.filters["field_encode_members"] = exporter._field_encode_members_for_node
+            env.filters["rdl_property"] = exporter._node_property
             template = env.get_template("stubs.pyi.jinja")
             return template.render(
                 soc_name="udp_stub_soc",